@@ -9,12 +9,134 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 import warnings
 warnings.filterwarnings('ignore')
 
+# Simulated engagement decay over the first 48 hours after posting
+_DECAY_HOURS = np.arange(0, 48)
+_DECAY_CURVE = 100.0 * np.exp(-_DECAY_HOURS / 12.0)
+
+# Shared layout for the 300px white-template charts in this module
+_LAYOUT_SMALL = dict(template='plotly_white', height=300, margin=dict(l=0, r=0, t=10, b=0))
+
+# Words ignored when ranking trending caption keywords
+_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+
+# ==================== Cached Aggregations ====================
+# The helpers below take a cheap fingerprint as their cache key; the frame
+# itself is passed as an underscore argument so Streamlit skips hashing it.
+def _fingerprint(df):
+    """Cheap cache key for a posts frame: shape plus timestamp range"""
+    if 'timestamp' in df.columns and len(df):
+        return (df.shape, str(df['timestamp'].min()), str(df['timestamp'].max()))
+    return (df.shape, None, None)
+
+
+def _as_text(series):
+    """Return series as a string-dtype Series, copying only if it is not one already"""
+    if isinstance(series.dtype, pd.StringDtype):
+        return series.fillna('')
+    return series.astype(str)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _daily_engagement(fp, _data):
+    """Cached daily likes/comments/shares totals"""
+    daily_engagement = _data.set_index('timestamp')[['likes', 'comments', 'shares']].resample('D').sum()
+    daily_engagement['total'] = daily_engagement.sum(axis=1)
+    return daily_engagement
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _media_hour_heatmap(fp, _data):
+    """Cached mean likes per media type and posting hour"""
+    media_type = _data['media_type'].astype('category')
+    return (
+        _data['likes']
+        .groupby([media_type, _data['hour']], observed=True)
+        .mean()
+        .unstack(fill_value=0)
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _hashtag_freq(fp, _hashtags):
+    """Cached top-10 hashtag frequencies"""
+    tags = _as_text(_hashtags).str.split('#').explode().str.strip()
+    return tags[tags != ''].value_counts().head(10)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _keyword_freq(fp, _captions):
+    """Cached top-15 caption keyword frequencies"""
+    words = _as_text(_captions).str.lower().str.split(expand=False).explode().dropna()
+    mask = ~words.isin(_STOP_WORDS) & (words.str.len() > 4)
+    return words[mask].value_counts().head(15)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _daily_followers(fp, _data):
+    """Cached last follower count per day"""
+    daily_followers = _data.set_index('timestamp')['follower_count'].resample('D').last().reset_index()
+    return daily_followers.dropna(subset=['follower_count'])
+
+
+@st.cache_data(show_spinner=False)
+def _sim_sentiment(n, seed=0):
+    """Cached simulated positive/neutral/negative sentiment shares"""
+    rng = np.random.default_rng(seed)
+    positive = rng.integers(40, 70, n)
+    negative = rng.integers(10, 30, n)
+    return positive, 100 - positive - negative, negative
+
+
+@st.cache_data(show_spinner=False)
+def _hashtag_positions(k, seed=1):
+    """Cached simulated node positions for the hashtag network"""
+    rng = np.random.default_rng(seed)
+    return rng.random(k) * 10, rng.random(k) * 10
+
+
+@st.cache_resource(show_spinner=False)
+def _engagement_forecast_fig():
+    """Cached Actual/AI Predicted figure skeleton; callers copy it and fill in x/y"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(name='Actual', line=dict(color='#6366f1', width=4)))
+    fig.add_trace(go.Scatter(name='AI Predicted', line=dict(color='#f093fb', width=4, dash='dot')))
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        height=300,
+        margin=dict(l=0, r=0, t=10, b=0),
+        hovermode='x unified',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _audience_forecast_fig():
+    """Cached Actual/Forecast follower figure skeleton; callers copy it and fill in x/y"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(name='Actual', line=dict(color='#10b981', width=3)))
+    fig.add_trace(go.Scatter(name='Forecast', line=dict(color='#f093fb', width=3, dash='dash')))
+    fig.update_layout(
+        **_LAYOUT_SMALL,
+        hovermode='x unified'
+    )
+    return fig
+
+
+def _linear_forecast(y, horizon):
+    """Least-squares line through y extrapolated `horizon` steps ahead"""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n < 2:
+        return np.full(horizon, y[-1] if n else 0.0)
+    slope, intercept = np.polyfit(np.arange(n), y, 1)
+    return slope * np.arange(n, n + horizon) + intercept
+
 
 # ==================== 2. Advanced Analytics with ML ====================
 def render_advanced_analytics_ml(data):
@@ -35,49 +157,15 @@ def render_advanced_analytics_ml(data):
             
             if all(col in data.columns for col in ['timestamp', 'likes', 'comments', 'shares']):
                 # Prepare time series data
-                data['timestamp'] = pd.to_datetime(data['timestamp'])
-                daily_engagement = data.groupby(pd.Grouper(key='timestamp', freq='D')).agg({
-                    'likes': 'sum',
-                    'comments': 'sum',
-                    'shares': 'sum'
-                })
-                daily_engagement['total'] = daily_engagement.sum(axis=1)
-                
-                # Simple linear forecast
-                from sklearn.linear_model import LinearRegression
-                X = np.arange(len(daily_engagement)).reshape(-1, 1)
-                y = daily_engagement['total'].values
-                
-                model = LinearRegression()
-                model.fit(X, y)
+                daily_engagement = _daily_engagement(_fingerprint(data), data[['timestamp', 'likes', 'comments', 'shares']])
                 
-                # Predict next 14 days
-                future_X = np.arange(len(daily_engagement), len(daily_engagement) + 14).reshape(-1, 1)
-                future_y = model.predict(future_X)
+                # Simple linear forecast for the next 14 days
+                future_y = _linear_forecast(daily_engagement['total'].values, 14)
                 future_dates = pd.date_range(start=daily_engagement.index[-1] + timedelta(days=1), periods=14, freq='D')
                 
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=daily_engagement.index,
-                    y=daily_engagement['total'],
-                    name='Actual',
-                    line=dict(color='#6366f1', width=4)
-                ))
-                fig.add_trace(go.Scatter(
-                    x=future_dates,
-                    y=future_y,
-                    name='AI Predicted',
-                    line=dict(color='#f093fb', width=4, dash='dot')
-                ))
-                
-                fig.update_layout(
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    hovermode='x unified',
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-                )
+                fig = go.Figure(_engagement_forecast_fig())
+                fig.data[0].x, fig.data[0].y = daily_engagement.index, daily_engagement['total'].values
+                fig.data[1].x, fig.data[1].y = future_dates, future_y
                 st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
             
             st.markdown('</div>', unsafe_allow_html=True)
@@ -89,13 +177,10 @@ def render_advanced_analytics_ml(data):
             st.markdown('<div class="pro-chart-title">📉 Engagement Decay Curve</div>', unsafe_allow_html=True)
             
             # Simulated decay curve
-            hours = np.arange(0, 48, 1)
-            decay = 100 * np.exp(-hours / 12)  # Exponential decay
-            
             fig = go.Figure()
             fig.add_trace(go.Scatter(
-                x=hours,
-                y=decay,
+                x=_DECAY_HOURS,
+                y=_DECAY_CURVE,
                 fill='tozeroy',
                 fillcolor='rgba(102, 126, 234, 0.2)',
                 line=dict(color='#667eea', width=3),
@@ -107,9 +192,7 @@ def render_advanced_analytics_ml(data):
                          annotation_text="90% engagement reached", annotation_position="right")
             
             fig.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
+                **_LAYOUT_SMALL,
                 xaxis_title="Hours After Posting",
                 yaxis_title="Engagement Remaining (%)"
             )
@@ -130,22 +213,16 @@ def render_advanced_analytics_ml(data):
             st.markdown('<div class="pro-chart-title">🎯 Post Type Efficiency Heatmap</div>', unsafe_allow_html=True)
             
             if 'media_type' in data.columns and 'timestamp' in data.columns:
-                data['hour'] = pd.to_datetime(data['timestamp']).dt.hour
-                heatmap_data = data.pivot_table(
-                    values='likes',
-                    index='media_type',
-                    columns='hour',
-                    aggfunc='mean',
-                    fill_value=0
-                )
+                if 'hour' not in data.columns:
+                    data['hour'] = data['timestamp'].dt.hour
+                heatmap_data = _media_hour_heatmap(_fingerprint(data), data[['hour', 'media_type', 'likes']])
                 
                 fig = go.Figure(data=go.Heatmap(
                     z=heatmap_data.values,
                     x=heatmap_data.columns,
                     y=heatmap_data.index,
                     colorscale='GnBu',
-                    text=heatmap_data.values.round(0),
-                    texttemplate="%{text}",
+                    texttemplate="%{z:.0f}",
                     textfont={"size": 10}
                 ))
                 
@@ -182,9 +259,7 @@ def render_advanced_analytics_ml(data):
             
             fig.update_traces(textposition='outside')
             fig.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
+                **_LAYOUT_SMALL,
                 showlegend=False,
                 xaxis_title="Importance Score"
             )
@@ -244,37 +319,20 @@ def render_advanced_analytics_ml(data):
             if 'timestamp' in data.columns:
                 # Simulate sentiment scores
                 dates = pd.date_range(start=data['timestamp'].min(), end=data['timestamp'].max(), periods=30)
-                sentiment_positive = np.random.randint(40, 70, 30)
-                sentiment_negative = np.random.randint(10, 30, 30)
-                sentiment_neutral = 100 - sentiment_positive - sentiment_negative
+                sentiment_positive, sentiment_neutral, sentiment_negative = _sim_sentiment(30)
+                
+                names = ['Positive', 'Neutral', 'Negative']
+                colors = ['rgba(16, 185, 129, 0.6)', 'rgba(100, 116, 139, 0.6)', 'rgba(239, 68, 68, 0.6)']
+                stacks = np.stack([sentiment_positive, sentiment_neutral, sentiment_negative])
                 
                 fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=dates, y=sentiment_positive,
-                    name='Positive',
-                    stackgroup='one',
-                    fillcolor='rgba(16, 185, 129, 0.6)',
-                    line=dict(width=0)
-                ))
-                fig.add_trace(go.Scatter(
-                    x=dates, y=sentiment_neutral,
-                    name='Neutral',
-                    stackgroup='one',
-                    fillcolor='rgba(100, 116, 139, 0.6)',
-                    line=dict(width=0)
-                ))
-                fig.add_trace(go.Scatter(
-                    x=dates, y=sentiment_negative,
-                    name='Negative',
-                    stackgroup='one',
-                    fillcolor='rgba(239, 68, 68, 0.6)',
-                    line=dict(width=0)
-                ))
+                fig.add_traces([
+                    go.Scatter(x=dates, y=ys, name=name, stackgroup='one', fillcolor=color, line=dict(width=0))
+                    for ys, name, color in zip(stacks, names, colors)
+                ])
                 
                 fig.update_layout(
-                    template='plotly_white',
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0),
+                    **_LAYOUT_SMALL,
                     hovermode='x unified',
                     yaxis_title="Sentiment %"
                 )
@@ -300,26 +358,20 @@ def render_content_performance_advanced(data):
         
         if 'hashtags' in data.columns:
             # Extract top hashtags
-            all_hashtags = []
-            for hashtags in data['hashtags'].astype(str):
-                tags = [t.strip() for t in hashtags.split('#') if t.strip()]
-                all_hashtags.extend(tags)
-            
-            hashtag_freq = pd.Series(all_hashtags).value_counts().head(10)
+            hashtag_freq = _hashtag_freq(_fingerprint(data), data['hashtags'])
             
             # Create network graph (simplified)
             fig = go.Figure()
             
             # Nodes
-            x_pos = np.random.rand(len(hashtag_freq)) * 10
-            y_pos = np.random.rand(len(hashtag_freq)) * 10
+            x_pos, y_pos = _hashtag_positions(len(hashtag_freq))
             
             fig.add_trace(go.Scatter(
                 x=x_pos,
                 y=y_pos,
                 mode='markers+text',
                 marker=dict(
-                    size=[v/10 for v in hashtag_freq.values],
+                    size=hashtag_freq.values / 10.0,
                     color=hashtag_freq.values,
                     colorscale='Purples',
                     showscale=True
@@ -393,10 +445,7 @@ def render_content_performance_advanced(data):
     st.markdown('<div class="pro-chart-title">🔥 Top Trending Keywords</div>', unsafe_allow_html=True)
     
     if 'caption' in data.columns:
-        all_words = ' '.join(data['caption'].astype(str)).lower().split()
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        keywords = [w for w in all_words if w not in stop_words and len(w) > 4]
-        keyword_freq = pd.Series(keywords).value_counts().head(15)
+        keyword_freq = _keyword_freq(_fingerprint(data), data['caption'])
         
         fig = px.bar(
             x=keyword_freq.values,
@@ -420,6 +469,67 @@ def render_content_performance_advanced(data):
 
 
 # ==================== 4. Advanced Audience Insights ====================
+# Static persona cards, rendered to HTML once at import time
+_PERSONAS = [
+    {
+        'name': 'Engaged Learners',
+        'size': 42,
+        'emoji': '🎓',
+        'description': 'Students who comment often and share educational content',
+        'engagement': 'High',
+        'color': '#667eea'
+    },
+    {
+        'name': 'Silent Observers',
+        'size': 35,
+        'emoji': '👀',
+        'description': 'Viewers who rarely like or comment but consume content regularly',
+        'engagement': 'Low',
+        'color': '#64748b'
+    },
+    {
+        'name': 'Influencer Fans',
+        'size': 23,
+        'emoji': '⭐',
+        'description': 'Accounts who engage with multiple brands and creators',
+        'engagement': 'Medium',
+        'color': '#f093fb'
+    }
+]
+
+
+def _persona_card_html(persona):
+    """HTML card for one audience persona"""
+    return f"""
+    <div style="background: linear-gradient(135deg, {persona['color']}15 0%, {persona['color']}25 100%);
+         flex: 1; padding: 1.2rem; border-radius: 12px; border-left: 4px solid {persona['color']};">
+        <div style="font-size: 2rem; text-align: center; margin-bottom: 0.5rem;">{persona['emoji']}</div>
+        <div style="font-weight: 700; font-size: 1.1rem; color: #1e293b; text-align: center; margin-bottom: 0.5rem;">
+            {persona['name']}
+        </div>
+        <div style="font-size: 0.9rem; color: #64748b; margin-bottom: 0.8rem; text-align: center;">
+            {persona['description']}
+        </div>
+        <div style="text-align: center;">
+            <span style="background: {persona['color']}; color: white; padding: 0.3rem 0.8rem; 
+                  border-radius: 20px; font-size: 0.85rem; font-weight: 600;">
+                {persona['size']}% of audience
+            </span>
+        </div>
+        <div style="margin-top: 0.8rem; text-align: center; font-size: 0.85rem;">
+            <strong>Engagement:</strong> {persona['engagement']}
+        </div>
+    </div>
+    """.strip()
+
+
+_PERSONAS_HTML = (
+    '<div style="display: flex; gap: 1rem;">'
+    + ''.join(_persona_card_html(persona) for persona in _PERSONAS)
+    + '</div>'
+)
+
+
 def render_audience_insights_advanced(data):
     """Advanced Audience Insights with Personas and Clusters"""
     st.markdown('<div class="pro-header fade-in">', unsafe_allow_html=True)
@@ -435,44 +545,17 @@ def render_audience_insights_advanced(data):
         st.markdown('<div class="pro-chart-title">📈 Audience Growth Forecast</div>', unsafe_allow_html=True)
         
         if 'timestamp' in data.columns and 'follower_count' in data.columns:
-            daily_followers = data.groupby(pd.Grouper(key='timestamp', freq='D'))['follower_count'].last().reset_index()
-            
-            # Remove NaN values before model training
-            daily_followers = daily_followers.dropna(subset=['follower_count'])
+            # NaN days are dropped inside the cached helper before model training
+            daily_followers = _daily_followers(_fingerprint(data), data[['timestamp', 'follower_count']])
             
             if len(daily_followers) > 0:
                 # Simple forecast
-                from sklearn.linear_model import LinearRegression
-                X = np.arange(len(daily_followers)).reshape(-1, 1)
-                y = daily_followers['follower_count'].values
-                
-                model = LinearRegression()
-                model.fit(X, y)
-                
-                future_X = np.arange(len(daily_followers), len(daily_followers) + 30).reshape(-1, 1)
-                future_y = model.predict(future_X)
+                future_y = _linear_forecast(daily_followers['follower_count'].values, 30)
                 future_dates = pd.date_range(start=daily_followers['timestamp'].iloc[-1] + timedelta(days=1), periods=30, freq='D')
                 
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=daily_followers['timestamp'],
-                    y=daily_followers['follower_count'],
-                    name='Actual',
-                    line=dict(color='#10b981', width=3)
-                ))
-                fig.add_trace(go.Scatter(
-                    x=future_dates,
-                    y=future_y,
-                    name='Forecast',
-                    line=dict(color='#f093fb', width=3, dash='dash')
-                ))
-                
-                fig.update_layout(
-                    template='plotly_white',
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    hovermode='x unified'
-                )
+                fig = go.Figure(_audience_forecast_fig())
+                fig.data[0].x, fig.data[0].y = daily_followers['timestamp'], daily_followers['follower_count'].values
+                fig.data[1].x, fig.data[1].y = future_dates, future_y
                 st.plotly_chart(fig, width='stretch')
             else:
                 st.info("Not enough data for forecasting")
@@ -506,9 +589,7 @@ def render_audience_insights_advanced(data):
         ))
         
         fig.update_layout(
-            template='plotly_white',
-            height=300,
-            margin=dict(l=0, r=0, t=10, b=0),
+            **_LAYOUT_SMALL,
             xaxis_title="Weeks Since Follow",
             yaxis_title="Percentage"
         )
@@ -524,62 +605,71 @@ def render_audience_insights_advanced(data):
     st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
     st.markdown('<div class="pro-chart-title">🎭 AI-Generated Audience Personas</div>', unsafe_allow_html=True)
     
-    personas = [
-        {
-            'name': 'Engaged Learners',
-            'size': 42,
-            'emoji': '🎓',
-            'description': 'Students who comment often and share educational content',
-            'engagement': 'High',
-            'color': '#667eea'
-        },
-        {
-            'name': 'Silent Observers',
-            'size': 35,
-            'emoji': '👀',
-            'description': 'Viewers who rarely like or comment but consume content regularly',
-            'engagement': 'Low',
-            'color': '#64748b'
-        },
-        {
-            'name': 'Influencer Fans',
-            'size': 23,
-            'emoji': '⭐',
-            'description': 'Accounts who engage with multiple brands and creators',
-            'engagement': 'Medium',
-            'color': '#f093fb'
-        }
-    ]
-    
-    cols = st.columns(3)
-    for col, persona in zip(cols, personas):
-        with col:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, {persona['color']}15 0%, {persona['color']}25 100%);
-                 padding: 1.2rem; border-radius: 12px; border-left: 4px solid {persona['color']};">
-                <div style="font-size: 2rem; text-align: center; margin-bottom: 0.5rem;">{persona['emoji']}</div>
-                <div style="font-weight: 700; font-size: 1.1rem; color: #1e293b; text-align: center; margin-bottom: 0.5rem;">
-                    {persona['name']}
-                </div>
-                <div style="font-size: 0.9rem; color: #64748b; margin-bottom: 0.8rem; text-align: center;">
-                    {persona['description']}
-                </div>
-                <div style="text-align: center;">
-                    <span style="background: {persona['color']}; color: white; padding: 0.3rem 0.8rem; 
-                          border-radius: 20px; font-size: 0.85rem; font-weight: 600;">
-                        {persona['size']}% of audience
-                    </span>
-                </div>
-                <div style="margin-top: 0.8rem; text-align: center; font-size: 0.85rem;">
-                    <strong>Engagement:</strong> {persona['engagement']}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+    st.markdown(_PERSONAS_HTML, unsafe_allow_html=True)
     
     st.markdown('</div>', unsafe_allow_html=True)
 
 
 # ==================== 🚀 AI Next Move Recommendation ====================
+# Enhanced AI recommendations with more detailed analysis
+_NEXT_MOVE_RECOMMENDATIONS = [
+    {
+        'action': 'Post carousel content at 8:00 PM with #UniversityLife',
+        'predicted_impact': '+22% engagement',
+        'confidence': '87%',
+        'priority': 'High',
+        'details': 'Based on historical data showing peak engagement during evening hours with educational content'
+    },
+    {
+        'action': 'Create 2 reels per week featuring student testimonials',
+        'predicted_impact': '+18% follower growth',
+        'confidence': '82%',
+        'priority': 'High',
+        'details': 'Reels have 3x higher reach than static posts; student testimonials drive authentic engagement'
+    },
+    {
+        'action': 'Reduce #MondayMotivation usage, add #CareerSuccess',
+        'predicted_impact': '+12% reach',
+        'confidence': '75%',
+        'priority': 'Medium',
+        'details': 'Industry hashtags perform 40% better than generic motivational tags'
+    },
+    {
+        'action': 'Post alumni success stories on weekends',
+        'predicted_impact': '+25% shares',
+        'confidence': '79%',
+        'priority': 'High',
+        'details': 'Weekend audiences are 35% more likely to share inspirational content'
+    }
+]
+
+
+def _recommendation_html(rec):
+    """HTML block for one next-move recommendation"""
+    priority_color = '#ef4444' if rec['priority'] == 'High' else '#fbbf24'
+    return f"""
+    <div class="pro-insight-item" style="border-left-color: {priority_color}; padding: 1rem; margin-bottom: 1rem; background: rgba(255, 255, 255, 0.7); border-radius: 8px;">
+        <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.5rem;">
+            <strong style="color: #1e293b; flex: 1;">🎯 {rec['action']}</strong>
+            <span style="background: {priority_color}; color: white; padding: 0.2rem 0.6rem; 
+                  border-radius: 12px; font-size: 0.75rem; font-weight: 600;">
+                {rec['priority']} Priority
+            </span>
+        </div>
+        <div style="display: flex; gap: 1.5rem; font-size: 0.85rem; color: #64748b; margin-top: 0.5rem;">
+            <div>📈 <strong>Impact:</strong> {rec['predicted_impact']}</div>
+            <div>🎯 <strong>Confidence:</strong> {rec['confidence']}</div>
+        </div>
+        <div style="font-size: 0.8rem; color: #475569; margin-top: 0.5rem; padding-top: 0.5rem; border-top: 1px solid #e2e8f0;">
+            {rec['details']}
+        </div>
+    </div>
+    """.strip()
+
+
+_AI_NEXT_MOVE_HTML = ''.join(_recommendation_html(rec) for rec in _NEXT_MOVE_RECOMMENDATIONS)
+
+
 def render_ai_next_move(data):
     """AI-Powered Next Move Recommendations"""
     try:
@@ -596,62 +686,7 @@ def render_ai_next_move(data):
         st.markdown('<div class="pro-insights fade-in" style="background: linear-gradient(135deg, #667eea15 0%, #764ba215 100%); border: 2px solid #667eea;">', unsafe_allow_html=True)
         st.markdown('### 🚀 AI "Next Move" Recommendations')
         
-        # Enhanced AI recommendations with more detailed analysis
-        recommendations = [
-            {
-                'action': 'Post carousel content at 8:00 PM with #UniversityLife',
-                'predicted_impact': '+22% engagement',
-                'confidence': '87%',
-                'priority': 'High',
-                'details': 'Based on historical data showing peak engagement during evening hours with educational content'
-            },
-            {
-                'action': 'Create 2 reels per week featuring student testimonials',
-                'predicted_impact': '+18% follower growth',
-                'confidence': '82%',
-                'priority': 'High',
-                'details': 'Reels have 3x higher reach than static posts; student testimonials drive authentic engagement'
-            },
-            {
-                'action': 'Reduce #MondayMotivation usage, add #CareerSuccess',
-                'predicted_impact': '+12% reach',
-                'confidence': '75%',
-                'priority': 'Medium',
-                'details': 'Industry hashtags perform 40% better than generic motivational tags'
-            },
-            {
-                'action': 'Post alumni success stories on weekends',
-                'predicted_impact': '+25% shares',
-                'confidence': '79%',
-                'priority': 'High',
-                'details': 'Weekend audiences are 35% more likely to share inspirational content'
-            }
-        ]
-        
-        for rec in recommendations:
-            try:
-                priority_color = '#ef4444' if rec['priority'] == 'High' else '#fbbf24'
-                st.markdown(f"""
-                <div class="pro-insight-item" style="border-left-color: {priority_color}; padding: 1rem; margin-bottom: 1rem; background: rgba(255, 255, 255, 0.7); border-radius: 8px;">
-                    <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.5rem;">
-                        <strong style="color: #1e293b; flex: 1;">🎯 {rec['action']}</strong>
-                        <span style="background: {priority_color}; color: white; padding: 0.2rem 0.6rem; 
-                              border-radius: 12px; font-size: 0.75rem; font-weight: 600;">
-                            {rec['priority']} Priority
-                        </span>
-                    </div>
-                    <div style="display: flex; gap: 1.5rem; font-size: 0.85rem; color: #64748b; margin-top: 0.5rem;">
-                        <div>📈 <strong>Impact:</strong> {rec['predicted_impact']}</div>
-                        <div>🎯 <strong>Confidence:</strong> {rec['confidence']}</div>
-                    </div>
-                    <div style="font-size: 0.8rem; color: #475569; margin-top: 0.5rem; padding-top: 0.5rem; border-top: 1px solid #e2e8f0;">
-                        {rec['details']}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            except Exception as e:
-                # Silently continue if one recommendation fails
-                continue
+        st.markdown(_AI_NEXT_MOVE_HTML, unsafe_allow_html=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
     except Exception as e:
@@ -779,8 +814,8 @@ def render_optimal_posting_times(data):
         # Analyze data to determine best posting times
         if 'timestamp' in data.columns and 'likes' in data.columns:
             try:
-                data['timestamp'] = pd.to_datetime(data['timestamp'])
-                data['hour'] = data['timestamp'].dt.hour
+                if 'hour' not in data.columns:
+                    data['hour'] = data['timestamp'].dt.hour
                 data['day_of_week'] = data['timestamp'].dt.day_name()
                 
                 # Group by hour and day to find optimal times
@@ -0,0 +1,7 @@
+"""
+Calendar Constants
+Dependency-free orderings shared by the dashboard sections and the ML pipeline
+"""
+
+# Weekday names in pandas dayofweek order, so DAYS_ORDER[code] names a code (Monday = 0)
+DAYS_ORDER = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
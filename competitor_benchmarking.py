@@ -7,58 +7,254 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import random
 
-def generate_competitor_data(num_competitors=3):
-    """Generate simulated competitor data for benchmarking"""
-    competitors = []
-    
+_RNG = np.random.default_rng()
+
+# Radar axes and layout shared by every render
+_RADAR_CATEGORIES = ('Engagement Rate', 'Posting Frequency', 'Growth Rate', 'Follower Base', 'Content Quality')
+_LAYOUT_RADAR = dict(
+    polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+    showlegend=True,
+    height=500,
+    uirevision='static',
+    template='plotly_white'
+)
+
+# Radar trace colors for competitors, with translucent fills precomputed from the hex codes
+_COMPETITOR_COLORS = ('#f093fb', '#4facfe', '#43e97b', '#fa709a', '#feca57')
+_COMPETITOR_FILLS = tuple(
+    f'rgba({int(c[1:3], 16)}, {int(c[3:5], 16)}, {int(c[5:7], 16)}, 0.1)' for c in _COMPETITOR_COLORS
+)
+
+SCORE_METRICS = ('followers', 'avg_engagement_rate', 'posts_per_week', 'growth_rate')
+
+@dataclass(frozen=True)
+class CompetitorMetrics:
+    """Scored competitor metrics as one float array per metric"""
+    followers: np.ndarray
+    avg_engagement_rate: np.ndarray
+    posts_per_week: np.ndarray
+    growth_rate: np.ndarray
+    
+    @classmethod
+    def from_frame(cls, df):
+        return cls(*(df[metric].to_numpy(dtype=np.float64) for metric in SCORE_METRICS))
+    
+    def as_matrix(self):
+        """(competitors x metrics) matrix in SCORE_METRICS order"""
+        return np.column_stack([getattr(self, metric) for metric in SCORE_METRICS])
+
+def generate_competitor_data(num_competitors=3, seed=None):
+    """Generate simulated competitor data as (CompetitorMetrics, display DataFrame)"""
     competitor_names = [
         "Competitor A", "Competitor B", "Competitor C", 
         "Competitor D", "Competitor E"
     ]
+    n = num_competitors
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+    
+    # One vectorized draw per column instead of one Python call per field
+    df = pd.DataFrame({
+        'name': competitor_names[:n],
+        'followers': rng.integers(50000, 500001, n),
+        'avg_engagement_rate': np.round(rng.uniform(2.5, 8.5, n), 2),
+        'posts_per_week': rng.integers(3, 16, n),
+        'avg_likes': rng.integers(1000, 15001, n),
+        'avg_comments': rng.integers(50, 801, n),
+        'avg_shares': rng.integers(20, 501, n),
+        'growth_rate': np.round(rng.uniform(-2, 15, n), 2),
+        'best_posting_time': np.char.add(rng.integers(6, 23, n).astype(str), ':00'),
+        'top_content_type': rng.choice(['Reels', 'Carousel', 'Static Image', 'Video'], n),
+        'hashtag_usage': rng.integers(5, 31, n),
+        'response_time': np.char.add(rng.integers(1, 25, n).astype(str), 'h'),
+        'story_frequency': rng.integers(2, 11, n)
+    })
+    return CompetitorMetrics.from_frame(df), df
+
+def calculate_competitive_score(competitor_metrics, your_vec):
+    """Calculate competitive positioning score
+    
+    your_vec holds your account's values in SCORE_METRICS order.
+    """
+    # Normalize metrics (0-100 scale) in one pass over the stacked matrix
+    stacked = np.vstack([competitor_metrics.as_matrix(), np.asarray(your_vec, dtype=np.float64)])
+    your_scores = normalize_scores(stacked)[-1]
     
-    for i in range(num_competitors):
-        competitors.append({
-            'name': competitor_names[i],
-            'followers': random.randint(50000, 500000),
-            'avg_engagement_rate': round(random.uniform(2.5, 8.5), 2),
-            'posts_per_week': random.randint(3, 15),
-            'avg_likes': random.randint(1000, 15000),
-            'avg_comments': random.randint(50, 800),
-            'avg_shares': random.randint(20, 500),
-            'growth_rate': round(random.uniform(-2, 15), 2),
-            'best_posting_time': f"{random.randint(6, 22)}:00",
-            'top_content_type': random.choice(['Reels', 'Carousel', 'Static Image', 'Video']),
-            'hashtag_usage': random.randint(5, 30),
-            'response_time': f"{random.randint(1, 24)}h",
-            'story_frequency': random.randint(2, 10)
-        })
-    
-    return pd.DataFrame(competitors)
+    scores = dict(zip(SCORE_METRICS, your_scores.tolist()))
+    overall_score = round(float(your_scores.mean()), 1)
+    return overall_score, scores
+
+def normalize_scores(values):
+    """Min-max scale each column of an (accounts x metrics) array to 0-100, 50 where constant"""
+    lo = values.min(axis=0)
+    hi = values.max(axis=0)
+    span = np.where(hi > lo, hi - lo, 1.0)
+    return np.round(np.where(hi > lo, (values - lo) / span * 100, 50.0), 1)
+
+@st.cache_data(show_spinner=False)
+def _build_competitor_data(num_competitors, seed):
+    """Cached, seeded competitor data so reruns see the same accounts"""
+    return generate_competitor_data(num_competitors, seed)
+
+def _simulate_your_data(seed):
+    """Simulated metrics for your account"""
+    # Its own stream under the shared seed, so it is not a rescaled copy of Competitor A
+    rng = np.random.default_rng([seed, 1])
+    
+    # One batch draw for the integer and float metrics
+    followers, posts_per_week, avg_likes, avg_comments, avg_shares = rng.integers(
+        [30000, 4, 800, 40, 15], [400001, 13, 12001, 601, 401]
+    ).tolist()
+    engagement_rate, growth_rate = np.round(rng.uniform([3.0, 1.0], [7.5, 12.0]), 2).tolist()
+    return {
+        'name': 'Your Account',
+        'followers': followers,
+        'avg_engagement_rate': engagement_rate,
+        'posts_per_week': posts_per_week,
+        'avg_likes': avg_likes,
+        'avg_comments': avg_comments,
+        'avg_shares': avg_shares,
+        'growth_rate': growth_rate,
+        'best_posting_time': "18:00",
+        'top_content_type': 'Reels',
+        'hashtag_usage': 15,
+        'response_time': "3h",
+        'story_frequency': 5
+    }
 
-def calculate_competitive_score(your_data, competitor_data):
-    """Calculate competitive positioning score"""
-    scores = {}
+@st.cache_data(show_spinner=False)
+def _compute_scores(your_items, _competitor_metrics, competitor_df):
+    """Cached competitive score plus radar scores for every account (yours first)"""
+    your_data = dict(your_items)
+    your_vec = np.array([your_data.get(metric, 0) for metric in SCORE_METRICS], dtype=np.float64)
+    overall_score, metric_scores = calculate_competitive_score(_competitor_metrics, your_vec)
+    
+    radar_metrics = ['avg_engagement_rate', 'posts_per_week', 'growth_rate', 'followers']
+    all_values = np.vstack([
+        [your_data.get(metric, 0) for metric in radar_metrics],
+        competitor_df[radar_metrics].to_numpy(dtype=np.float64)
+    ])
+    return overall_score, metric_scores, normalize_scores(all_values)
+
+@st.cache_data(show_spinner=False)
+def _styled_table_html(df_records, columns, your_name='Your Account'):
+    """Cached HTML for the comparison table with your account's row highlighted"""
+    display_df = pd.DataFrame(list(df_records), columns=list(columns))
+    
+    # Highlight your account; row styles are built once for the known column count
+    highlighted = ['background-color: #e8f4f8'] * len(display_df.columns)
+    plain = [''] * len(display_df.columns)
     
-    # Normalize metrics (0-100 scale)
-    metrics = ['followers', 'avg_engagement_rate', 'posts_per_week', 'growth_rate']
+    def highlight_your_account(row):
+        return highlighted if row['Account'] == your_name else plain
     
-    for metric in metrics:
-        all_values = list(competitor_data[metric]) + [your_data.get(metric, 0)]
-        max_val = max(all_values)
-        min_val = min(all_values)
+    styled = display_df.style.apply(highlight_your_account, axis=1).format(precision=2).hide(axis='index')
+    return styled.to_html()
+
+@st.cache_data(show_spinner=False)
+def _build_radar_fig(names, radar_scores, seed):
+    """Cached multi-dimensional radar as figure JSON; row 0 of radar_scores is your account"""
+    rng = random.Random(seed)
+    
+    fig = go.Figure()
+    
+    # Add your account
+    your_values = list(radar_scores[0]) + [rng.randint(60, 95)]  # Content quality score
+    
+    fig.add_trace(go.Scatterpolar(
+        r=your_values,
+        theta=_RADAR_CATEGORIES,
+        fill='toself',
+        name='Your Account',
+        line_color='#667eea',
+        fillcolor='rgba(102, 126, 234, 0.3)'
+    ))
+    
+    # Add competitors
+    for idx, name in enumerate(names[1:]):
+        comp_values = list(radar_scores[idx + 1]) + [rng.randint(50, 90)]
         
-        if max_val > min_val:
-            your_score = ((your_data.get(metric, 0) - min_val) / (max_val - min_val)) * 100
-        else:
-            your_score = 50
-            
-        scores[metric] = round(your_score, 1)
+        fig.add_trace(go.Scatterpolar(
+            r=comp_values,
+            theta=_RADAR_CATEGORIES,
+            fill='toself',
+            name=name,
+            line_color=_COMPETITOR_COLORS[idx % len(_COMPETITOR_COLORS)],
+            fillcolor=_COMPETITOR_FILLS[idx % len(_COMPETITOR_FILLS)]
+        ))
     
-    overall_score = round(sum(scores.values()) / len(scores), 1)
-    return overall_score, scores
+    fig.update_layout(**_LAYOUT_RADAR)
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False)
+def _build_bar_figs(all_accounts):
+    """Cached engagement-rate and growth-rate comparison bars as figure JSON"""
+    fig_bar = go.Figure()
+    
+    fig_bar.add_trace(go.Bar(
+        x=all_accounts['name'],
+        y=all_accounts['avg_engagement_rate'],
+        marker_color=np.where(all_accounts['name'].to_numpy() == 'Your Account', '#667eea', '#94a3b8'),
+        text=all_accounts['avg_engagement_rate'],
+        textposition='auto',
+    ))
+    
+    fig_bar.update_layout(
+        title="Engagement Rate Comparison",
+        xaxis_title="Account",
+        yaxis_title="Engagement Rate (%)",
+        height=400,
+        uirevision='static',
+        template='plotly_white'
+    )
+    
+    fig_growth = go.Figure()
+    
+    fig_growth.add_trace(go.Bar(
+        x=all_accounts['name'],
+        y=all_accounts['growth_rate'],
+        marker_color=np.where(all_accounts['growth_rate'].to_numpy() > 0, '#43e97b', '#fa709a'),
+        text=all_accounts['growth_rate'],
+        textposition='auto',
+    ))
+    
+    fig_growth.update_layout(
+        title="Growth Rate Comparison",
+        xaxis_title="Account",
+        yaxis_title="Growth Rate (%)",
+        height=400,
+        uirevision='static',
+        template='plotly_white'
+    )
+    return fig_bar.to_json(), fig_growth.to_json()
+
+@st.cache_data(show_spinner=False)
+def _build_pie_fig(all_accounts):
+    """Cached share-of-voice donut as figure JSON"""
+    all_accounts = all_accounts.copy()
+    
+    # Calculate share of voice (based on followers + engagement) as one fused expression
+    followers = all_accounts['followers'].to_numpy(dtype=np.float64)
+    engagement = all_accounts['avg_engagement_rate'].to_numpy(dtype=np.float64)
+    sov = followers * (0.4 + 0.6 * engagement)
+    all_accounts['sov_percentage'] = sov / sov.sum() * 100
+    
+    fig_pie = px.pie(
+        all_accounts,
+        values='sov_percentage',
+        names='name',
+        title='Market Share of Voice',
+        color_discrete_sequence=px.colors.qualitative.Set3,
+        hole=0.4
+    )
+    
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+    fig_pie.update_layout(height=500, uirevision='static')
+    return fig_pie.to_json()
 
 def render_competitor_benchmarking(your_data=None):
     """Main rendering function for competitor benchmarking"""
@@ -75,29 +271,28 @@ def render_competitor_benchmarking(your_data=None):
     with col2:
         time_period = st.selectbox("Time Period", ["Last 7 Days", "Last 30 Days", "Last 90 Days", "Last Year"])
     
+    # Seed once per session so the simulated accounts stay stable across reruns
+    if 'competitor_seed' not in st.session_state:
+        st.session_state.competitor_seed = random.randrange(2**31)
+    seed = st.session_state.competitor_seed
+    
     # Generate competitor data
-    competitor_df = generate_competitor_data(num_competitors)
+    competitor_metrics, competitor_df = _build_competitor_data(num_competitors, seed)
     
     # Your account data (simulated if not provided)
     if your_data is None:
-        your_data = {
-            'name': 'Your Account',
-            'followers': random.randint(30000, 400000),
-            'avg_engagement_rate': round(random.uniform(3.0, 7.5), 2),
-            'posts_per_week': random.randint(4, 12),
-            'avg_likes': random.randint(800, 12000),
-            'avg_comments': random.randint(40, 600),
-            'avg_shares': random.randint(15, 400),
-            'growth_rate': round(random.uniform(1, 12), 2),
-            'best_posting_time': "18:00",
-            'top_content_type': 'Reels',
-            'hashtag_usage': 15,
-            'response_time': "3h",
-            'story_frequency': 5
-        }
+        if 'your_data' not in st.session_state:
+            st.session_state.your_data = _simulate_your_data(seed)
+        your_data = st.session_state.your_data
     
     # Calculate competitive score
-    overall_score, metric_scores = calculate_competitive_score(your_data, competitor_df)
+    overall_score, metric_scores, radar_scores = _compute_scores(tuple(your_data.items()), competitor_metrics, competitor_df)
+    
+    # Combine your data with competitors
+    all_accounts = pd.concat([
+        pd.DataFrame([your_data]),
+        competitor_df
+    ], ignore_index=True)
     
     # Display competitive score
     st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
@@ -110,7 +305,7 @@ def render_competitor_benchmarking(your_data=None):
                  delta=f"{round(overall_score - 50, 1)} vs avg" if overall_score > 50 else f"{round(overall_score - 50, 1)} vs avg")
     
     with col2:
-        rank = sum(1 for comp in competitor_df.itertuples() if comp.avg_engagement_rate > your_data['avg_engagement_rate']) + 1
+        rank = int((competitor_df['avg_engagement_rate'].to_numpy() > your_data['avg_engagement_rate']).sum()) + 1
         st.metric("Market Rank", f"#{rank}/{num_competitors + 1}")
     
     with col3:
@@ -126,57 +321,7 @@ def render_competitor_benchmarking(your_data=None):
     st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
     st.markdown('<div class="pro-chart-title">🕸️ Multi-Dimensional Competitive Analysis</div>', unsafe_allow_html=True)
     
-    categories = ['Engagement Rate', 'Posting Frequency', 'Growth Rate', 'Follower Base', 'Content Quality']
-    
-    fig = go.Figure()
-    
-    # Add your account
-    your_values = [
-        metric_scores['avg_engagement_rate'],
-        metric_scores['posts_per_week'],
-        metric_scores['growth_rate'],
-        metric_scores['followers'],
-        random.randint(60, 95)  # Content quality score
-    ]
-    
-    fig.add_trace(go.Scatterpolar(
-        r=your_values,
-        theta=categories,
-        fill='toself',
-        name='Your Account',
-        line_color='#667eea',
-        fillcolor='rgba(102, 126, 234, 0.3)'
-    ))
-    
-    # Add competitors
-    colors = ['#f093fb', '#4facfe', '#43e97b', '#fa709a', '#feca57']
-    for idx, comp in competitor_df.iterrows():
-        _, comp_scores = calculate_competitive_score(comp.to_dict(), competitor_df.drop(idx))
-        comp_values = [
-            comp_scores['avg_engagement_rate'],
-            comp_scores['posts_per_week'],
-            comp_scores['growth_rate'],
-            comp_scores['followers'],
-            random.randint(50, 90)
-        ]
-        
-        fig.add_trace(go.Scatterpolar(
-            r=comp_values,
-            theta=categories,
-            fill='toself',
-            name=comp['name'],
-            line_color=colors[idx % len(colors)],
-            fillcolor=f'rgba({int(colors[idx % len(colors)][1:3], 16)}, {int(colors[idx % len(colors)][3:5], 16)}, {int(colors[idx % len(colors)][5:7], 16)}, 0.1)'
-        ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(visible=True, range=[0, 100])
-        ),
-        showlegend=True,
-        height=500,
-        template='plotly_white'
-    )
+    fig = pio.from_json(_build_radar_fig(tuple(all_accounts['name']), radar_scores, seed))
     
     st.plotly_chart(fig, use_container_width=True)
     st.markdown('</div>', unsafe_allow_html=True)
@@ -184,12 +329,6 @@ def render_competitor_benchmarking(your_data=None):
     # Detailed Metrics Comparison Table
     st.markdown("### 📋 Detailed Metrics Comparison")
     
-    # Combine your data with competitors
-    all_accounts = pd.concat([
-        pd.DataFrame([your_data]),
-        competitor_df
-    ], ignore_index=True)
-    
     # Format the dataframe for display
     display_df = all_accounts[[
         'name', 'followers', 'avg_engagement_rate', 'posts_per_week', 
@@ -199,64 +338,25 @@ def render_competitor_benchmarking(your_data=None):
     display_df.columns = ['Account', 'Followers', 'Engagement %', 'Posts/Week', 
                           'Growth %', 'Top Content', 'Best Time']
     
-    # Highlight your account
-    def highlight_your_account(row):
-        if row['Account'] == 'Your Account':
-            return ['background-color: #e8f4f8'] * len(row)
-        return [''] * len(row)
-    
-    styled_df = display_df.style.apply(highlight_your_account, axis=1)
-    st.dataframe(styled_df, use_container_width=True, height=300)
+    table_html = _styled_table_html(
+        tuple(map(tuple, display_df.itertuples(index=False))),
+        tuple(display_df.columns)
+    )
+    st.markdown(table_html, unsafe_allow_html=True)
     
     # Engagement Rate Comparison
     st.markdown("### 📈 Engagement Rate Trends")
     
+    fig_bar, fig_growth = map(pio.from_json, _build_bar_figs(all_accounts))
+    
     col1, col2 = st.columns(2)
     
     with col1:
         # Bar chart comparison
-        fig_bar = go.Figure()
-        
-        fig_bar.add_trace(go.Bar(
-            x=all_accounts['name'],
-            y=all_accounts['avg_engagement_rate'],
-            marker_color=['#667eea' if name == 'Your Account' else '#94a3b8' 
-                         for name in all_accounts['name']],
-            text=all_accounts['avg_engagement_rate'],
-            textposition='auto',
-        ))
-        
-        fig_bar.update_layout(
-            title="Engagement Rate Comparison",
-            xaxis_title="Account",
-            yaxis_title="Engagement Rate (%)",
-            height=400,
-            template='plotly_white'
-        )
-        
         st.plotly_chart(fig_bar, use_container_width=True)
     
     with col2:
         # Growth rate comparison
-        fig_growth = go.Figure()
-        
-        fig_growth.add_trace(go.Bar(
-            x=all_accounts['name'],
-            y=all_accounts['growth_rate'],
-            marker_color=['#43e97b' if rate > 0 else '#fa709a' 
-                         for rate in all_accounts['growth_rate']],
-            text=all_accounts['growth_rate'],
-            textposition='auto',
-        ))
-        
-        fig_growth.update_layout(
-            title="Growth Rate Comparison",
-            xaxis_title="Account",
-            yaxis_title="Growth Rate (%)",
-            height=400,
-            template='plotly_white'
-        )
-        
         st.plotly_chart(fig_growth, use_container_width=True)
     
     # Content Strategy Insights
@@ -299,9 +399,9 @@ def render_competitor_benchmarking(your_data=None):
             threats.append(f"⚠️ **Activity Threat**: {most_active['name']} posts {most_active['posts_per_week']} times/week - significantly more than you.")
         
         # Check follower growth
-        fast_growers = competitor_df[competitor_df['growth_rate'] > your_data['growth_rate'] * 1.3]
-        if len(fast_growers) > 0:
-            threats.append(f"⚠️ **Growth Threat**: {len(fast_growers)} competitor(s) are growing faster than you.")
+        num_fast_growers = int((competitor_df['growth_rate'].to_numpy() > your_data['growth_rate'] * 1.3).sum())
+        if num_fast_growers > 0:
+            threats.append(f"⚠️ **Growth Threat**: {num_fast_growers} competitor(s) are growing faster than you.")
         
         # Check engagement
         if competitor_df['avg_engagement_rate'].max() > your_data['avg_engagement_rate'] * 1.2:
@@ -341,25 +441,7 @@ def render_competitor_benchmarking(your_data=None):
     # Share of Voice Analysis
     st.markdown("### 🎤 Share of Voice Analysis")
     
-    # Calculate share of voice (based on followers + engagement)
-    all_accounts['sov_score'] = (
-        all_accounts['followers'] * 0.4 + 
-        all_accounts['avg_engagement_rate'] * all_accounts['followers'] * 0.6
-    )
-    
-    all_accounts['sov_percentage'] = (all_accounts['sov_score'] / all_accounts['sov_score'].sum()) * 100
-    
-    fig_pie = px.pie(
-        all_accounts,
-        values='sov_percentage',
-        names='name',
-        title='Market Share of Voice',
-        color_discrete_sequence=px.colors.qualitative.Set3,
-        hole=0.4
-    )
-    
-    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-    fig_pie.update_layout(height=500)
+    fig_pie = pio.from_json(_build_pie_fig(all_accounts))
     
     st.plotly_chart(fig_pie, use_container_width=True)
     
@@ -2,182 +2,292 @@
 Dashboard Extensions Module
 Additional charts and components for deep dive analysis
 """
+import functools
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to NumPy reductions
+    njit = None
+
+# Treemap shows at most this many media types, ranked by total engagement
+MAX_TREEMAP_MEDIA_TYPES = 20
+
+# Treemap engagement tercile labels, lowest first
+ENGAGEMENT_LEVELS = ('Low', 'Medium', 'High')
+
+# Metrics considered for the correlation heatmap
+CORRELATION_METRICS = ('likes', 'comments', 'shares', 'saves', 'impressions', 'reach', 'follower_count', 'sentiment_score', 'subjectivity')
+
+@functools.lru_cache(maxsize=8)
+def _relevant_numeric_cols(columns, dtypes):
+    """Numeric correlation metrics present in a frame, memoized on its column/dtype signature"""
+    return tuple(
+        col for col, dtype in zip(columns, dtypes)
+        if col in CORRELATION_METRICS and pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(dtype))
+    )
+
+if njit is not None:
+    @njit(parallel=True, nogil=True, cache=True)
+    def _funnel_sums(imp, reach, likes, comments, shares):
+        """Impressions, reach and engagement totals fused into one pass (NaN counts as 0)"""
+        ti = 0.0
+        tr = 0.0
+        te = 0.0
+        for i in prange(len(imp)):
+            if not np.isnan(imp[i]):
+                ti += imp[i]
+            if not np.isnan(reach[i]):
+                tr += reach[i]
+            for v in (likes[i], comments[i], shares[i]):
+                if not np.isnan(v):
+                    te += v
+        return ti, tr, te
+else:
+    def _funnel_sums(imp, reach, likes, comments, shares):
+        """Impressions, reach and engagement totals (NaN counts as 0)"""
+        return float(np.nansum(imp)), float(np.nansum(reach)), float(np.nansum(likes) + np.nansum(comments) + np.nansum(shares))
+
+if njit is not None:
+    @njit(nogil=True, cache=True)
+    def _group_mean_normalized(codes, vals, ngroups):
+        """Per-group column means (NaN skipped), each column scaled by its max when positive"""
+        ncols = vals.shape[1]
+        sums = np.zeros((ngroups, ncols))
+        counts = np.zeros((ngroups, ncols))
+        for i in range(len(codes)):
+            g = codes[i]
+            if g < 0:
+                continue
+            for j in range(ncols):
+                v = vals[i, j]
+                if not np.isnan(v):
+                    sums[g, j] += v
+                    counts[g, j] += 1.0
+        out = np.full((ngroups, ncols), np.nan)
+        for j in range(ncols):
+            col_max = -np.inf
+            for g in range(ngroups):
+                if counts[g, j] > 0:
+                    out[g, j] = sums[g, j] / counts[g, j]
+                    if out[g, j] > col_max:
+                        col_max = out[g, j]
+            if col_max > 0:
+                for g in range(ngroups):
+                    out[g, j] /= col_max
+        return out
+else:
+    def _group_mean_normalized(codes, vals, ngroups):
+        """Per-group column means (NaN skipped), each column scaled by its max when positive"""
+        keep = codes >= 0
+        codes, vals = codes[keep], vals[keep]
+        valid = ~np.isnan(vals)
+        out = np.empty((ngroups, vals.shape[1]))
+        for j in range(vals.shape[1]):
+            mask = valid[:, j]
+            sums = np.bincount(codes[mask], weights=vals[mask, j], minlength=ngroups)
+            counts = np.bincount(codes[mask], minlength=ngroups)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                out[:, j] = np.where(counts > 0, sums / counts, np.nan)
+        col_max = np.max(out, axis=0, initial=-np.inf, where=~np.isnan(out))
+        return np.where(col_max > 0, out / np.where(col_max > 0, col_max, 1.0), out)
+
+def _chart_card(title):
+    """Bordered container holding one titled chart, mounted as a single element"""
+    card = st.container(border=True)
+    card.markdown(f'<div class="pro-chart-title">{title}</div>', unsafe_allow_html=True)
+    return card
+
+def _prepare(data, max_rows=None):
+    """Randomly downsample data to max_rows for charts of means or correlations, where a sample is a fair estimate"""
+    if max_rows is None or len(data) <= max_rows:
+        return data
+    return data.sample(n=max_rows, random_state=0)
+
 def render_engagement_funnel(data):
     """Render an engagement funnel chart (Impressions -> Reach -> Engagement)"""
-    st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
-    st.markdown('<div class="pro-chart-title">🔻 Engagement Funnel</div>', unsafe_allow_html=True)
-    
-    if all(col in data.columns for col in ['impressions', 'reach', 'likes', 'comments', 'shares']):
-        # Aggregate metrics
-        total_impressions = data['impressions'].sum()
-        total_reach = data['reach'].sum()
-        
-        # Calculate distinct engagement
-        # Assuming simple sum for engagement actions
-        total_engagement = data['likes'].sum() + data['comments'].sum() + data['shares'].sum()
-        
-        # Create funnel stages
-        stages = ['Impressions', 'Reach', 'Engagement']
-        values = [total_impressions, total_reach, total_engagement]
-        
-        fig = go.Figure(go.Funnel(
-            y=stages,
-            x=values,
-            textinfo="value+percent previous",
-            marker = {"color": ["#667eea", "#764ba2", "#10b981"]}
-        ))
-        
-        fig.update_layout(
-            template='plotly_white',
-            height=350,
-            margin=dict(l=0, r=0, t=10, b=0)
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Insight
-        if total_reach > 0:
-            conv_rate = (total_engagement / total_reach) * 100
-            st.markdown(f"💡 **Conversion Rate:** {conv_rate:.1f}% of reached users engaged with content")
+    # Totals over every post; a row sample would understate them
+    with _chart_card('🔻 Engagement Funnel'):
+        if not data.empty and all(col in data.columns for col in ['impressions', 'reach', 'likes', 'comments', 'shares']):
+            # Aggregate metrics; engagement assumes a simple sum of engagement actions
+            total_impressions, total_reach, total_engagement = _funnel_sums(*(
+                data[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                for col in ('impressions', 'reach', 'likes', 'comments', 'shares')
+            ))
             
-    else:
-        st.info("Required metrics (impressions, reach, engagement) not available for funnel analysis")
-        
-    st.markdown('</div>', unsafe_allow_html=True)
+            # Create funnel stages
+            stages = ['Impressions', 'Reach', 'Engagement']
+            values = [total_impressions, total_reach, total_engagement]
+            
+            fig = go.Figure(go.Funnel(
+                y=stages,
+                x=values,
+                textinfo="value+percent previous",
+                marker = {"color": ["#667eea", "#764ba2", "#10b981"]}
+            ))
+            
+            fig.update_layout(
+                template='plotly_white',
+                height=350,
+                uirevision='static',
+                margin=dict(l=0, r=0, t=10, b=0)
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Insight
+            if total_reach > 0:
+                conv_rate = (total_engagement / total_reach) * 100
+                st.markdown(f"💡 **Conversion Rate:** {conv_rate:.1f}% of reached users engaged with content")
+                
+        else:
+            st.info("Required metrics (impressions, reach, engagement) not available for funnel analysis")
 
-def render_metric_radar(data):
+def render_metric_radar(data, max_rows=None):
     """Render a radar chart comparing media types"""
-    st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
-    st.markdown('<div class="pro-chart-title">🕸️ Media Performance Radar</div>', unsafe_allow_html=True)
-    
-    if 'media_type' in data.columns and all(col in data.columns for col in ['likes', 'comments', 'shares', 'reach']):
-        # Normalize metrics for fair comparison
-        metrics = ['likes', 'comments', 'shares', 'reach']
-        
-        # Group by media type
-        grouped = data.groupby('media_type')[metrics].mean()
-        
-        # Max scaling for radar chart (0-1 range)
-        normalized = grouped.copy()
-        for col in metrics:
-            if normalized[col].max() > 0:
-                normalized[col] = normalized[col] / normalized[col].max()
-        
-        fig = go.Figure()
-        
-        colors = ['#667eea', '#10b981', '#f59e0b', '#ef4444']
-        
-        for i, (media_type, row) in enumerate(normalized.iterrows()):
-            color = colors[i % len(colors)]
-            fig.add_trace(go.Scatterpolar(
-                r=row.values,
-                theta=[m.title() for m in metrics],
-                fill='toself',
-                name=str(media_type),
-                line=dict(color=color)
-            ))
+    with _chart_card('🕸️ Media Performance Radar'):
+        data = _prepare(data, max_rows)
+        if 'media_type' in data.columns and all(col in data.columns for col in ['likes', 'comments', 'shares', 'reach']):
+            # Normalize metrics for fair comparison
+            metrics = ['likes', 'comments', 'shares', 'reach']
             
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 1]
-                )
-            ),
-            showlegend=True,
-            template='plotly_white',
-            height=400,
-            margin=dict(l=40, r=40, t=20, b=20),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02)
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-    else:
-        st.info("Missing media type or metric columns for radar analysis")
-        
-    st.markdown('</div>', unsafe_allow_html=True)
+            # Group by media type, then max-scale each metric for the radar chart (0-1 range)
+            codes, media_types = pd.factorize(data['media_type'], sort=True)
+            normalized = pd.DataFrame(
+                _group_mean_normalized(
+                    codes.astype(np.int64),
+                    data[metrics].to_numpy(dtype=np.float64, na_value=np.nan),
+                    len(media_types)
+                ),
+                index=media_types,
+                columns=metrics
+            )
+            
+            fig = go.Figure()
+            
+            colors = ['#667eea', '#10b981', '#f59e0b', '#ef4444']
+            
+            for i, (media_type, row) in enumerate(normalized.iterrows()):
+                color = colors[i % len(colors)]
+                fig.add_trace(go.Scatterpolar(
+                    r=row.values,
+                    theta=[m.title() for m in metrics],
+                    fill='toself',
+                    name=str(media_type),
+                    line=dict(color=color)
+                ))
+                
+            fig.update_layout(
+                polar=dict(
+                    radialaxis=dict(
+                        visible=True,
+                        range=[0, 1]
+                    )
+                ),
+                showlegend=True,
+                template='plotly_white',
+                height=400,
+                uirevision='static',
+                margin=dict(l=40, r=40, t=20, b=20),
+                legend=dict(orientation="h", yanchor="bottom", y=1.02)
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+        else:
+            st.info("Missing media type or metric columns for radar analysis")
 
 def render_treemap_content(data):
     """Render a treemap of content performance"""
-    st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
-    st.markdown('<div class="pro-chart-title">📦 Content Distribution Treemap</div>', unsafe_allow_html=True)
-    
-    if 'media_type' in data.columns and 'likes' in data.columns:
-        # Prepare hierarchy
-        # If we have hashtags, we could use top hashtag per post, otherwise just use media type -> engagement
-        
-        df = data.copy()
-        df['total_engagement'] = df['likes'] + df.get('comments', 0) + df.get('shares', 0)
-        
-        # Simplified grouping for visual clarity
-        # Group by Media Type -> Top 5 Posts (by ID or Caption snippet)
-        
-        # Just purely Media Type distribution for now might be too simple. 
-        # Let's try to simulate a sub-category if possible, or just individual posts if not too many.
-        # If many posts, bin them.
-        
-        # Let's do Media Type -> Engagement bin
-        df['engagement_level'] = pd.qcut(df['total_engagement'], q=3, labels=['Low', 'Medium', 'High'])
-        
-        grouped = df.groupby(['media_type', 'engagement_level']).size().reset_index(name='count')
-        grouped['avg_engagement'] = df.groupby(['media_type', 'engagement_level'])['total_engagement'].mean().values
-        
-        fig = px.treemap(
-            grouped,
-            path=[px.Constant("All Content"), 'media_type', 'engagement_level'],
-            values='count',
-            color='avg_engagement',
-            color_continuous_scale='Purples'
-        )
-        
-        fig.update_layout(
-            template='plotly_white',
-            height=350,
-            margin=dict(l=0, r=0, t=10, b=0)
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-    st.markdown('</div>', unsafe_allow_html=True)
+    # Tile sizes are post counts, so every row is kept; size is bounded by the top media types instead
+    with _chart_card('📦 Content Distribution Treemap'):
+        if 'media_type' in data.columns and 'likes' in data.columns:
+            # Prepare hierarchy
+            # If we have hashtags, we could use top hashtag per post, otherwise just use media type -> engagement
+            
+            # Only the two columns the treemap reads, not a copy of the whole frame
+            df = data[['media_type']].assign(
+                total_engagement=data.reindex(columns=['likes', 'comments', 'shares'], fill_value=0).sum(axis=1)
+            )
+            
+            # Keep the tile count bounded when there are many media types
+            top_types = df.groupby('media_type', observed=True)['total_engagement'].sum().nlargest(MAX_TREEMAP_MEDIA_TYPES).index
+            df = df[df['media_type'].isin(top_types)]
+            
+            # Simplified grouping for visual clarity
+            # Group by Media Type -> Top 5 Posts (by ID or Caption snippet)
+            
+            # Just purely Media Type distribution for now might be too simple. 
+            # Let's try to simulate a sub-category if possible, or just individual posts if not too many.
+            # If many posts, bin them.
+            
+            # Let's do Media Type -> Engagement bin, tercile edges as in qcut (right-closed bins)
+            arr = df['total_engagement'].to_numpy(dtype=np.float64)
+            edges = np.quantile(arr, [1 / 3, 2 / 3]) if len(arr) else np.zeros(2)
+            df['engagement_level'] = pd.Categorical.from_codes(
+                np.searchsorted(edges, arr, side='left'), categories=list(ENGAGEMENT_LEVELS)
+            )
+            
+            grouped = df.groupby(['media_type', 'engagement_level'], observed=True).agg(
+                count=('total_engagement', 'size'),
+                avg_engagement=('total_engagement', 'mean')
+            ).reset_index()
+            
+            fig = px.treemap(
+                grouped,
+                path=[px.Constant("All Content"), 'media_type', 'engagement_level'],
+                values='count',
+                color='avg_engagement',
+                color_continuous_scale='Purples'
+            )
+            
+            fig.update_layout(
+                template='plotly_white',
+                height=350,
+                uirevision='static',
+                margin=dict(l=0, r=0, t=10, b=0)
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
 
-def render_correlation_heatmap(data):
+def render_correlation_heatmap(data, max_rows=50_000):
     """Render correlation matrix"""
-    st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
-    st.markdown('<div class="pro-chart-title">🌡️ Metric Correlations</div>', unsafe_allow_html=True)
-    
-    numeric_cols = data.select_dtypes(include=[np.number]).columns
-    # Filter for relevant metrics
-    relevant = [c for c in numeric_cols if c in ['likes', 'comments', 'shares', 'saves', 'impressions', 'reach', 'follower_count', 'sentiment_score', 'subjectivity']]
-    
-    if len(relevant) > 1:
-        corr = data[relevant].corr()
+    with _chart_card('🌡️ Metric Correlations'):
+        # A random sample estimates the correlations closely at a fraction of the cost
+        data = _prepare(data, max_rows)
+        # Filter for relevant numeric metrics
+        relevant = list(_relevant_numeric_cols(tuple(data.columns), tuple(str(t) for t in data.dtypes)))
         
-        fig = go.Figure(data=go.Heatmap(
-            z=corr.values,
-            x=[c.title().replace('_', ' ') for c in corr.columns],
-            y=[c.title().replace('_', ' ') for c in corr.index],
-            colorscale='RdBu',
-            zmin=-1, zmax=1,
-            text=np.round(corr.values, 2),
-            texttemplate="%{text}",
-            textfont={"size": 10}
-        ))
-        
-        fig.update_layout(
-            template='plotly_white',
-            height=400,
-            margin=dict(l=0, r=0, t=10, b=0)
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-    else:
-        st.info("Not enough numeric metrics for correlation analysis")
-        
-    st.markdown('</div>', unsafe_allow_html=True)
+        if len(relevant) > 1:
+            # Single BLAS-backed corrcoef over rows that have every metric
+            arr = data[relevant].to_numpy(dtype=np.float64, na_value=np.nan)
+            arr = arr[~np.isnan(arr).any(axis=1)]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr_vals = np.corrcoef(arr, rowvar=False)
+            labels = [c.title().replace('_', ' ') for c in relevant]
+            
+            fig = go.Figure(data=go.Heatmap(
+                z=corr_vals,
+                x=labels,
+                y=labels,
+                colorscale='RdBu',
+                zmin=-1, zmax=1,
+                text=np.round(corr_vals, 2),
+                texttemplate="%{text}",
+                textfont={"size": 10}
+            ))
+            
+            fig.update_layout(
+                template='plotly_white',
+                height=400,
+                uirevision='static',
+                margin=dict(l=0, r=0, t=10, b=0)
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Not enough numeric metrics for correlation analysis")
@@ -8,470 +8,983 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from datetime import datetime, timedelta
 import warnings
+from dataclasses import dataclass
+from advanced_techniques import _fingerprint
+from calendar_constants import DAYS_ORDER
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; grouped sums fall back to np.bincount
+    njit = None
+
+# Shared chart styling: plotly_white plus the flush margins every section uses
+pio.templates['pro'] = go.layout.Template(layout=dict(margin=dict(l=0, r=0, t=10, b=0)))
+_SECTION_TEMPLATE = 'plotly_white+pro'
+
+# Caption-length buckets: inner edges, exclusive upper limit and labels
+CAPTION_LENGTH_EDGES = np.array([50, 100, 150, 200])
+CAPTION_LENGTH_MAX = 500
+CAPTION_LENGTH_LABELS = ['0-50', '51-100', '101-150', '151-200', '200+']
+
+# Engagement metrics and the calendar orderings used by the time-based charts
+ENGAGEMENT_COLUMNS = ['likes', 'comments', 'shares']
+SEASON_ORDER = ['Winter', 'Spring', 'Summer', 'Fall']
+# Position in SEASON_ORDER for each month number 1-12; slot 0 (a missing month) maps to -1
+SEASON_BY_MONTH = np.array([-1, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0], dtype=np.int64)
+# 12-hour clock label for each hour of the day, midnight and noon shown as 12
+HOUR_LABELS = [f"{hour % 12 or 12}:00 {'AM' if hour < 12 else 'PM'}" for hour in range(24)]
+
+# Long time series are thinned to about this many points before they are sent to the browser
+MAX_TIMESERIES_POINTS = 1000
+
+
+def _downsample_series(x, y, max_points=MAX_TIMESERIES_POINTS):
+    """Thin a long series to its per-bucket min and max points so peaks and dips survive"""
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    if len(y) <= max_points:
+        return x, y
+    
+    edges = np.linspace(0, len(y), max_points // 2 + 1).astype(np.int64)
+    lows = np.where(np.isnan(y), np.inf, y)
+    highs = np.where(np.isnan(y), -np.inf, y)
+    keep = np.unique(np.concatenate([
+        [start + np.argmin(lows[start:stop]) for start, stop in zip(edges[:-1], edges[1:])],
+        [start + np.argmax(highs[start:stop]) for start, stop in zip(edges[:-1], edges[1:])]
+    ]))
+    return x[keep], y[keep]
+
+
+if njit is not None:
+    @njit(nogil=True, cache=True)
+    def _grouped_sums(codes, values, ngroups):
+        """(ngroups x columns) sums of values by integer group code; code -1 and NaN are skipped"""
+        out = np.zeros((ngroups, values.shape[1]))
+        for i in range(len(codes)):
+            g = codes[i]
+            if g >= 0:
+                for j in range(values.shape[1]):
+                    if not np.isnan(values[i, j]):
+                        out[g, j] += values[i, j]
+        return out
+else:
+    def _grouped_sums(codes, values, ngroups):
+        """(ngroups x columns) sums of values by integer group code; code -1 and NaN are skipped"""
+        keep = codes >= 0
+        codes, values = codes[keep], np.nan_to_num(values[keep])
+        sums = [np.bincount(codes, weights=values[:, j], minlength=ngroups) for j in range(values.shape[1])]
+        return np.column_stack(sums) if sums else np.zeros((ngroups, 0))
+
+
+if njit is not None:
+    @njit(nogil=True, cache=True)
+    def _linear_fit(y):
+        """Closed-form least-squares (slope, intercept) of y against 0..n-1; needs n >= 2"""
+        n = len(y)
+        sx = sy = sxx = sxy = 0.0
+        for i in range(n):
+            sx += i
+            sy += y[i]
+            sxx += i * i
+            sxy += i * y[i]
+        slope = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+        return slope, (sy - slope * sx) / n
+else:
+    def _linear_fit(y):
+        """Closed-form least-squares (slope, intercept) of y against 0..n-1; needs n >= 2"""
+        slope, intercept = np.polyfit(np.arange(len(y)), y, 1)
+        return slope, intercept
+
+
+def _pct_growth(values):
+    """Percent change from each value to the next, NaN first, like pct_change() * 100 on the raw float array"""
+    values = np.asarray(values, dtype=np.float64)
+    growth = np.empty_like(values)
+    growth[:1] = np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth[1:] = 100.0 * np.diff(values) / values[:-1]
+    return growth
+
+
+def _window_sums(values, window):
+    """Trailing sums over the last window points of a float array, from one cumulative sum"""
+    totals = np.concatenate(([0.0], np.cumsum(values)))
+    starts = np.maximum(np.arange(1, len(values) + 1) - window, 0)
+    return totals[1:] - totals[starts]
+
+
+def _moving_stats(values, window, min_count=1, ddof=1):
+    """Trailing moving mean and std, NaN-skipping and NaN below min_count values, like bottleneck.move_mean/move_std"""
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    counts = _window_sums(valid.astype(np.float64), window)
+    sums = _window_sums(filled, window)
+    squares = _window_sums(filled * filled, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = sums / counts
+        std = np.sqrt(np.maximum(squares - sums * mean, 0.0) / (counts - ddof))
+    mean[counts < min_count] = np.nan
+    std[(counts < min_count) | (counts <= ddof)] = np.nan
+    return mean, std
+
+
+def _sum_by(keys, values, key_name):
+    """Column sums of the numeric frame values per key, shaped like groupby(keys).sum().reset_index()"""
+    codes, uniques = pd.factorize(keys, sort=True)
+    sums = _grouped_sums(codes.astype(np.int64), values.to_numpy(dtype=np.float64, na_value=np.nan), len(uniques))
+    summed = pd.DataFrame(sums, columns=values.columns)
+    summed.insert(0, key_name, np.asarray(uniques))
+    return summed
+
+
+def _aggregate_codes(codes, values, ngroups, how):
+    """groupby(codes).agg(how) over the numeric frame values for small integer codes, via _grouped_sums
+
+    Code -1 marks a missing key and NaN values are skipped. Sums cover every code in [0, ngroups),
+    like a resample; means keep only the codes that occur, like a groupby.
+    """
+    matrix = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    sums = _grouped_sums(codes, matrix, ngroups)
+    if how == 'sum':
+        # Integer columns stay integer, as pandas sums them
+        return pd.DataFrame(sums, columns=values.columns).astype(
+            {col: np.int64 for col in values.columns if pd.api.types.is_integer_dtype(values[col])})
+    
+    counts = _grouped_sums(codes, (~np.isnan(matrix)).astype(np.float64), ngroups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = pd.DataFrame(sums / counts, columns=values.columns)
+    return means[np.bincount(codes[codes >= 0], minlength=ngroups) > 0]
+
+
+def _last_by_code(codes, values, ngroups, order):
+    """Last non-missing value per integer code in [0, ngroups) with rows visited in order, NaN where none
+
+    With order the rows' stable timestamp argsort this matches resample(...).last(); code -1 marks a missing key.
+    """
+    codes = codes[order]
+    values = values.to_numpy(dtype=np.float64, na_value=np.nan)[order]
+    positions = np.flatnonzero((codes >= 0) & ~np.isnan(values))
+    last = np.full(ngroups, -1)
+    np.maximum.at(last, codes[positions], positions)
+    return np.where(last >= 0, values[last], np.nan)
+
+
+def _numeric(data, names):
+    """Whichever of names data has, as numbers with invalid or missing values set to 0"""
+    cols = _columns(data, names)
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in cols.dtypes):
+        # The loader already produced numeric columns; skip the parse pass
+        return cols.fillna(0)
+    return cols.apply(pd.to_numeric, errors='coerce').fillna(0)
+
+
+def _peak(series):
+    """Position and value of the largest non-missing entry, found in one pass over the numpy values"""
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    i = int(np.nanargmax(values))
+    return i, values[i]
+
+
+def _top_k(values, k):
+    """Positions of the k largest values, largest first, via an O(N) partition instead of a full sort"""
+    values = np.asarray(values, dtype=np.float64)
+    values = np.where(np.isnan(values), -np.inf, values)
+    if len(values) > k:
+        candidates = np.argpartition(values, -k)[-k:]
+    else:
+        candidates = np.arange(len(values))
+    return candidates[np.argsort(-values[candidates], kind='stable')]
+
+
+def _timestamps(data):
+    """The timestamp column as datetime64, parsed only when the loader has not already done so"""
+    ts = data['timestamp']
+    if pd.api.types.is_datetime64_any_dtype(ts):
+        return ts
+    return pd.to_datetime(ts, errors='coerce', cache=True)
+
+
+def _hours(data, ts):
+    """Hour of day as int64 array, reusing the loader's hour column instead of re-deriving it"""
+    hour = data['hour'] if 'hour' in data.columns else ts.dt.hour
+    return hour.dropna().to_numpy(dtype=np.int64)
+
+
+def _columns(data, names):
+    """Subset of data holding whichever of names it has, so cached helpers hash only what they use"""
+    return data[[col for col in names if col in data.columns]]
+
+
+@st.cache_data(show_spinner=False)
+def _hashtag_summary(data):
+    """Total likes, reach and post count per hashtag from the comma-separated hashtags column"""
+    # Explode by position so a non-unique index on data cannot misalign the metrics
+    tags = data['hashtags'].reset_index(drop=True).dropna().astype(str).str.split(',').explode()
+    tags = tags.str.strip().str.lower()
+    tags = tags[tags != '']
+    
+    metrics = data.reindex(columns=['likes', 'reach'], fill_value=0).iloc[tags.index.to_numpy()]
+    return metrics.assign(hashtag=tags.to_numpy()).groupby('hashtag').agg(
+        likes=('likes', 'sum'),
+        reach=('reach', 'sum'),
+        count=('likes', 'size')
+    ).reset_index()
+
+
+@st.cache_data(show_spinner=False)
+def _media_performance(data):
+    """Cached mean likes/comments/shares per media type"""
+    return data.groupby('media_type', observed=True).agg({
+        'likes': 'mean',
+        'comments': 'mean' if 'comments' in data.columns else 'count',
+        'shares': 'mean' if 'shares' in data.columns else 'count'
+    }).round(0).reset_index()
+
+
+@st.cache_data(show_spinner=False)
+def _length_performance(data):
+    """Cached mean engagement per caption-length bucket"""
+    # Buckets are [0, 50), [50, 100), ..., [200, 500); longer captions fall outside every bucket
+    lengths = data['caption'].astype(str).str.len().to_numpy()
+    in_range = lengths < CAPTION_LENGTH_MAX
+    group = np.searchsorted(CAPTION_LENGTH_EDGES, lengths[in_range], side='right')
+    n_groups = len(CAPTION_LENGTH_LABELS)
+    
+    means = {}
+    for col in [c for c in ('likes', 'comments', 'shares') if c in data.columns]:
+        values = data[col].to_numpy(dtype=np.float64, na_value=np.nan)[in_range]
+        valid = ~np.isnan(values)
+        sums = np.bincount(group[valid], weights=values[valid], minlength=n_groups)
+        counts = np.bincount(group[valid], minlength=n_groups)
+        means[col] = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+    
+    length_performance = pd.DataFrame(means, index=pd.Index(CAPTION_LENGTH_LABELS, name='length_group')).round(1)
+    # Like groupby(observed=True), only buckets that hold at least one caption are reported
+    return length_performance[np.bincount(group, minlength=n_groups) > 0]
+
+
+@st.cache_data(show_spinner=False)
+def _daily_posts(data):
+    """Cached number of posts per calendar day"""
+    return data.groupby(pd.Grouper(key='timestamp', freq='D')).size()
+
+
+@st.cache_data(show_spinner=False)
+def _corr_matrix(data):
+    """Cached correlation matrix of the given metric columns, over rows where all of them are present"""
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values).any(axis=1)]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.corrcoef(values, rowvar=False)
+
+
+# The time-based helpers below work on _trend_frame output, whose timestamps are parsed once
+def _engagement_spec(data, how):
+    """Aggregation spec applying how to each engagement column present in data"""
+    return {col: how for col in ENGAGEMENT_COLUMNS if col in data.columns}
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _time_aggregates(fp, _data):
+    """Cached daily, hourly, day-of-week, weekly-heatmap, monthly and seasonal aggregates in one pass
+
+    Keyed on the posts frame's fingerprint fp, so a rerun neither hashes nor re-parses the frame.
+    'daily' always holds the engagement totals and the closing follower count per day; the
+    engagement-only tables are present when data has likes, which every chart using them plots.
+    """
+    data = _trend_frame(_data)
+    ts = data['timestamp']
+    sums = _engagement_spec(data, 'sum')
+    metrics = data[list(sums)]
+    
+    # One daily table: engagement totals plus the last follower count of each day, empty days kept
+    days = ts.dt.floor('D')
+    if days.notna().any():
+        first = days.min()
+        day_codes = ((days - first) // pd.Timedelta(days=1)).fillna(-1).to_numpy(dtype=np.int64)
+        n_days = int(day_codes.max()) + 1
+        daily = _aggregate_codes(day_codes, metrics, n_days, 'sum')
+        if 'follower_count' in data.columns:
+            order = np.argsort(ts.to_numpy(), kind='stable')
+            daily['follower_count'] = _last_by_code(day_codes, data['follower_count'], n_days, order)
+        daily.index = pd.date_range(first, periods=n_days, freq='D', name='timestamp').as_unit(ts.dt.unit)
+    else:
+        # No parseable timestamps: an empty daily table with the same columns
+        daily = _columns(data, [*sums, 'follower_count']).iloc[:0].set_axis(
+            pd.DatetimeIndex([], name='timestamp').as_unit(ts.dt.unit))
+    
+    if 'likes' not in data.columns:
+        return {'daily': daily}
+    
+    # Each grouping key is derived once and shared by every aggregate that needs it
+    hour = ts.dt.hour.fillna(-1).to_numpy(dtype=np.int64)
+    weekday = ts.dt.dayofweek.fillna(-1).to_numpy(dtype=np.int64)
+    month = ts.to_numpy(dtype='datetime64[M]')
+    season = SEASON_BY_MONTH[ts.dt.month.fillna(0).to_numpy(dtype=np.int64)]
+    
+    # Monthly totals keyed on months since the first one; only months with posts are kept and
+    # their 'YYYY-MM' labels are formatted straight from datetime64[M]
+    has_month = ~np.isnat(month)
+    first_month = month[has_month].min() if has_month.any() else np.datetime64('NaT', 'M')
+    month_codes = np.where(has_month, (month - first_month).astype(np.int64), -1)
+    n_months = int(month_codes.max()) + 1 if has_month.any() else 0
+    occupied_months = np.bincount(month_codes[has_month], minlength=n_months) > 0
+    monthly = _aggregate_codes(month_codes, metrics, n_months, 'sum')[occupied_months].reset_index(drop=True)
+    monthly.insert(0, 'month_str', np.datetime_as_string(first_month + np.flatnonzero(occupied_months), unit='M'))
+    
+    # Hour, weekday and season are dense small integer keys, aggregated by the grouped-sum kernel
+    hourly = _aggregate_codes(hour, metrics, 24, 'mean')
+    dow = _aggregate_codes(weekday, metrics, 7, 'mean').round(1)
+    seasonal = _aggregate_codes(season, metrics, 4, 'mean').round(1)
+    
+    # Weekly heatmap: mean likes on a dense 7 x 24 (weekday, hour) grid, 0 where a cell has no likes,
+    # trimmed to the weekdays and hours that have posts as pivot_table would
+    cell = np.where(weekday >= 0, weekday * 24 + hour, -1)
+    cell_means = _aggregate_codes(cell, data[['likes']], 7 * 24, 'mean')['likes'].fillna(0)
+    grid = np.zeros(7 * 24)
+    grid[cell_means.index] = cell_means.to_numpy()
+    grid = grid.reshape(7, 24)
+    occupied = np.bincount(cell[cell >= 0], minlength=7 * 24).reshape(7, 24) > 0
+    weekly = pd.DataFrame(
+        grid,
+        index=pd.Index(DAYS_ORDER, name='day_of_week'),
+        columns=pd.Index(np.arange(24), name='hour')
+    ).loc[occupied.any(axis=1), occupied.any(axis=0)]
+    
+    return {
+        'daily': daily,
+        'hourly': hourly.rename_axis('hour'),
+        'weekly': weekly,
+        'dow': dow.set_axis(np.asarray(DAYS_ORDER)[dow.index.to_numpy()]).rename_axis('day_of_week'),
+        'monthly': monthly,
+        'seasonal': seasonal.set_axis(np.asarray(SEASON_ORDER)[seasonal.index.to_numpy()]).rename_axis('season'),
+    }
+
+
+def _trend_frame(data):
+    """Timestamp, engagement and follower columns of data, with the timestamps parsed once"""
+    trend_data = _columns(data, ['timestamp', *ENGAGEMENT_COLUMNS, 'follower_count'])
+    if 'timestamp' in trend_data.columns:
+        trend_data = trend_data.assign(timestamp=_timestamps(data))
+    return trend_data
+
+
+@st.cache_data(show_spinner=False)
+def _engagement_by(data, key, how):
+    """Cached engagement aggregated per value of the key column"""
+    return data.groupby(key, observed=True).agg(_engagement_spec(data, how))
+
+
+@st.cache_data(show_spinner=False)
+def _gender_age_crosstab(data):
+    """Cached post counts per (audience gender, audience age) pair"""
+    return pd.crosstab(data['audience_gender'], data['audience_age'])
+
 
 # ==================== 1. Content Performance ====================
+@dataclass(frozen=True)
+class _ContentInputs:
+    """Everything the content charts read, prepared once per render"""
+    data: pd.DataFrame
+    cols: frozenset
+    ts: pd.Series = None
+    numeric: pd.DataFrame = None
+    hashtags: pd.DataFrame = None
+
+
+def _build_media_type(inputs):
+    media_performance = _media_performance(_columns(inputs.data, ['media_type', 'likes', 'comments', 'shares']))
+    
+    fig = px.bar(media_performance, x='media_type', y=['likes', 'comments', 'shares'],
+                 barmode='group',
+                 color_discrete_map={'likes': '#6366f1', 'comments': '#f093fb', 'shares': '#10b981'})
+    
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        height=300,
+        margin=dict(l=0, r=0, t=10, b=0),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        xaxis_title="",
+        yaxis_title="Avg Engagement"
+    )
+    
+    i, best_likes = _peak(media_performance['likes'])
+    best_type = media_performance['media_type'].iloc[i]
+    return fig, [f"""
+    <div style="background: rgba(99, 102, 241, 0.05); padding: 0.5rem 1rem; border-radius: 10px; border-left: 3px solid #6366f1;">
+        💡 <b>{best_type}</b> content generates <b>{best_likes:.0f}</b> avg likes.
+    </div>
+    """]
+
+
+def _build_top_posts(inputs):
+    total_engagement = inputs.numeric[['likes', 'comments', 'shares']].sum(axis=1).reset_index(drop=True)
+    
+    # Only the five winning rows are materialized, not a copy of the whole frame
+    top_positions = _top_k(total_engagement.to_numpy(), 5)
+    top_5 = inputs.data.iloc[top_positions].assign(total_engagement=total_engagement.iloc[top_positions].to_numpy())
+    
+    # Truncate the five captions in one vectorized pass
+    captions = top_5['caption'].astype(str)
+    short = captions.str.slice(0, 55)
+    captions = short.where(captions.str.len() <= 55, short + "...")
+    
+    # All five rows go out as one static HTML block rather than one element per post
+    rows_html = "".join(f"""
+        <div style="display: flex; justify-content: space-between; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #f1f5f9;">
+            <div style="font-size: 0.9rem; color: #1e293b; font-weight: 500;">{cap}</div>
+            <div style="font-weight: 700; color: #6366f1;">{int(engagement):,}</div>
+        </div>""" for cap, engagement in zip(captions, top_5['total_engagement']))
+    return None, [rows_html]
+
+
+def _build_hashtag_engagement(inputs):
+    if len(inputs.hashtags) == 0:  # No hashtag data
+        return None
+    top_10 = inputs.hashtags.iloc[_top_k(inputs.hashtags['likes'].to_numpy(), 10)]
+    
+    fig = px.scatter(
+        top_10,
+        x='count',
+        y='likes',
+        size='reach',
+        color='likes',
+        text='hashtag',
+        color_continuous_scale=['#667eea', '#764ba2', '#f093fb'],
+        render_mode='webgl'
+    )
+    
+    fig.update_traces(textposition='top center')
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title="Hashtag Frequency",
+        yaxis_title="Total Likes"
+    )
+    return fig, []
+
+
+def _build_hashtag_reach(inputs):
+    if len(inputs.hashtags) == 0:  # No hashtag data
+        return None
+    top_10 = inputs.hashtags.iloc[_top_k(inputs.hashtags['reach'].to_numpy(), 10)]
+    
+    fig = px.bar(
+        top_10,
+        x='reach',
+        y='hashtag',
+        orientation='h',
+        color='reach',
+        color_continuous_scale=['#667eea', '#764ba2', '#f093fb']
+    )
+    
+    fig.update_traces(texttemplate='%{x:,.0f}', textposition='outside')
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=350,
+        showlegend=False
+    )
+    return fig, []
+
+
+def _build_content_length(inputs):
+    length_performance = _length_performance(_columns(inputs.data, ['caption', 'likes', 'comments', 'shares']))
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='Avg Likes', x=length_performance.index, y=length_performance['likes'],
+                         marker_color='#667eea'))
+    if 'comments' in inputs.cols:
+        fig.add_trace(go.Bar(name='Avg Comments', x=length_performance.index, y=length_performance['comments'],
+                             marker_color='#f093fb'))
+    if 'shares' in inputs.cols:
+        fig.add_trace(go.Bar(name='Avg Shares', x=length_performance.index, y=length_performance['shares'],
+                             marker_color='#10b981'))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        barmode='group',
+        xaxis_title='Caption Length (characters)',
+        yaxis_title='Average Engagement'
+    )
+    
+    # Best length insight
+    i, best_likes = _peak(length_performance['likes'])
+    best_length = length_performance.index[i]
+    return fig, [f"💡 Optimal caption length: **{best_length}** chars ({best_likes:.1f} avg likes)"]
+
+
+def _build_posting_frequency(inputs):
+    daily_posts = _daily_posts(inputs.ts.to_frame())
+    
+    freq_x, freq_y = _downsample_series(daily_posts.index, daily_posts.values)
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=freq_x,
+        y=freq_y,
+        mode='lines+markers',
+        name='Posts per Day',
+        line=dict(color='#667eea', width=3),
+        marker=dict(size=6)
+    ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title='Date',
+        yaxis_title='Number of Posts'
+    )
+    
+    # Frequency insights
+    return fig, [f"📊 Average: **{daily_posts.mean():.1f}** posts/day",
+                 f"📈 Peak: **{daily_posts.max()}** posts/day"]
+
+
+def _build_engagement_rate_by_type(inputs):
+    if len(inputs.data) == 0:
+        return None
+    type_metrics = _sum_by(inputs.data['media_type'], inputs.numeric[['likes', 'impressions']], 'media_type')
+    
+    # Calculate engagement rate (avoid division by zero)
+    type_metrics['engagement_rate'] = np.where(
+        type_metrics['impressions'] > 0,
+        (type_metrics['likes'] / type_metrics['impressions']) * 100,
+        0
+    )
+    
+    fig = px.bar(
+        type_metrics,
+        x='media_type',
+        y='engagement_rate',
+        color='engagement_rate',
+        color_continuous_scale=['#667eea', '#764ba2', '#f093fb']
+    )
+    
+    fig.update_traces(texttemplate='%{y:.2~f}%', textposition='outside')
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        showlegend=False,
+        xaxis_title="Content Type",
+        yaxis_title="Engagement Rate (%)"
+    )
+    
+    # Best content type insight
+    if type_metrics.empty:
+        return fig, []
+    i, best_rate = _peak(type_metrics['engagement_rate'])
+    best_type = type_metrics['media_type'].iloc[i]
+    return fig, [f"💡 **{best_type}** has highest engagement rate at {best_rate:.2f}%"]
+
+
+def _build_saves(inputs):
+    # Group just the numeric saves column by media type
+    saves_by_type = inputs.numeric['saves'].groupby(inputs.data['media_type'], observed=True).mean().round(1)
+    
+    fig = px.bar(
+        x=saves_by_type.index,
+        y=saves_by_type.values,
+        color=saves_by_type.values,
+        color_continuous_scale=['#10b981', '#667eea', '#f093fb']
+    )
+    
+    fig.update_traces(texttemplate='%{y:,}', textposition='outside')
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        showlegend=False,
+        xaxis_title="Content Type",
+        yaxis_title="Average Saves"
+    )
+    
+    # Best saving content insight
+    if saves_by_type.empty:
+        return fig, []
+    i, best_saves = _peak(saves_by_type)
+    return fig, [f"💾 **{saves_by_type.index[i]}** gets {best_saves:.1f} avg saves per post"]
+
+
+def _build_correlation(inputs):
+    corr_metrics = ['likes', 'comments', 'shares']
+    corr_data = _corr_matrix(inputs.data[corr_metrics])
+    
+    fig = go.Figure(data=go.Heatmap(
+        z=corr_data,
+        x=corr_metrics,
+        y=corr_metrics,
+        colorscale='RdBu',
+        texttemplate="%{z:.2~f}",
+        textfont={"size": 12}
+    ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title="Metrics",
+        yaxis_title="Metrics"
+    )
+    
+    # Correlation insights
+    likes_comments_corr = corr_data[0, 1]
+    if abs(likes_comments_corr) > 0.7:
+        strength = "Strong"
+    elif abs(likes_comments_corr) > 0.4:
+        strength = "Moderate"
+    else:
+        strength = "Weak"
+    return fig, [f"🔗 {strength} correlation between likes and comments (**{likes_comments_corr:.2f}**)"]
+
+
+def _build_content_comparison(inputs):
+    content_comparison = _columns(inputs.data, ['media_type', 'likes', 'comments', 'shares']).groupby('media_type', observed=True).agg({
+        'likes': ['mean', 'std'],
+        'comments': ['mean', 'std'] if 'comments' in inputs.cols else ['count', 'count'],
+        'shares': ['mean', 'std'] if 'shares' in inputs.cols else ['count', 'count']
+    })
+    
+    # Flatten column names
+    content_comparison.columns = ['_'.join(col).strip() for col in content_comparison.columns.values]
+    content_comparison = content_comparison.reset_index()
+    
+    # Melt for visualization
+    melted_data = content_comparison.melt(id_vars=['media_type'], 
+                                        value_vars=[col for col in content_comparison.columns if 'mean' in col],
+                                        var_name='metric', 
+                                        value_name='average')
+    melted_data['metric'] = melted_data['metric'].str.replace('_mean', '')
+    
+    fig = px.bar(melted_data, 
+                 x='media_type', 
+                 y='average', 
+                 color='metric',
+                 barmode='group',
+                 color_discrete_sequence=['#667eea', '#f093fb', '#10b981'])
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title="Content Type",
+        yaxis_title="Average Engagement"
+    )
+    return fig, []
+
+
+# Content charts in display order, rendered two per row. Each builder returns (figure or None, notes),
+# or None when there is nothing to plot; 'missing' is the notice shown instead, if any.
+_CONTENT_CHARTS = [
+    {'title': '🎭 Media Type Performance', 'required': frozenset({'media_type', 'likes'}),
+     'missing': "⚠️ Data missing for Media Type analysis. Required columns: 'media_type', 'likes'",
+     'build': _build_media_type, 'config': {'displayModeBar': False}},
+    {'title': '🏆 Top Performing Posts', 'required': frozenset({'likes', 'comments', 'shares'}),
+     'missing': "⚠️ Data missing for Top Posts.",
+     'build': _build_top_posts},
+    {'title': '🏷️ Top Hashtags by Engagement', 'required': frozenset({'hashtags', 'likes'}),
+     'missing': None, 'build': _build_hashtag_engagement},
+    {'title': '🧮 Top 10 Hashtags by Reach', 'required': frozenset({'hashtags', 'reach'}),
+     'missing': None, 'build': _build_hashtag_reach},
+    {'title': '📝 Content Length Impact', 'required': frozenset({'caption', 'likes'}),
+     'missing': "⚠️ Data missing for Content Length analysis. Required: 'caption', 'likes'",
+     'build': _build_content_length},
+    {'title': '📊 Posting Frequency Analysis', 'required': frozenset({'timestamp'}),
+     'missing': "⚠️ Data missing for Frequency analysis. Required: 'timestamp'",
+     'build': _build_posting_frequency},
+    {'title': '📊 Engagement Rate by Content Type', 'required': frozenset({'media_type', 'likes', 'impressions'}),
+     'missing': "⚠️ Data missing for Engagement Rate analysis. Required: 'media_type', 'likes', 'impressions'",
+     'build': _build_engagement_rate_by_type},
+    {'title': '💾 Saves Analysis', 'required': frozenset({'saves', 'media_type'}),
+     'missing': "⚠️ Data missing for Saves analysis. Required: 'saves', 'media_type'",
+     'build': _build_saves},
+    {'title': '🔗 Engagement Correlation', 'required': frozenset({'likes', 'comments', 'shares'}),
+     'missing': "⚠️ Data missing for Correlation analysis. Required: 'likes', 'comments', 'shares'",
+     'build': _build_correlation},
+    {'title': '⚖️ Content Type Comparison', 'required': frozenset({'media_type', 'likes'}),
+     'missing': "⚠️ Data missing for Content Type comparison. Required: 'media_type', 'likes'",
+     'build': _build_content_comparison},
+]
+
+
+def _render_chart_card(spec, inputs):
+    """Render one chart spec inside a glass card, or its missing-data notice"""
+    st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
+    st.markdown(f'<div class="pro-chart-title">{spec["title"]}</div>', unsafe_allow_html=True)
+    
+    built = spec['build'](inputs) if spec['required'] <= inputs.cols else None
+    if built is not None:
+        fig, notes = built
+        if fig is not None:
+            st.plotly_chart(fig, use_container_width=True, config=spec.get('config'))
+        for note in notes:
+            st.markdown(note, unsafe_allow_html=True)
+    elif spec['missing']:
+        st.info(spec['missing'])
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
 def render_content_performance(data):
     """Analyze content performance with hashtag analysis and engagement metrics"""
     from professional_dashboard import render_professional_header
     render_professional_header("🎬 Content Performance", "Analyze what kind of content performs best")
-
+    
+    # Parse timestamps, coerce the metric columns and summarize hashtags at most once for every chart
+    cols = frozenset(data.columns)
+    inputs = _ContentInputs(
+        data=data,
+        cols=cols,
+        ts=_timestamps(data) if 'timestamp' in cols else None,
+        numeric=_numeric(data, ['likes', 'comments', 'shares', 'impressions', 'saves']),
+        hashtags=_hashtag_summary(_columns(data, ['hashtags', 'likes', 'reach'])) if 'hashtags' in cols else None
+    )
     
     # Add AI recommendations for content performance
     from advanced_techniques import render_trending_content_suggestions
     render_trending_content_suggestions(data)
     
-    # Row 1: Media Type Performance & Top Posts
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
-        st.markdown('<div class="pro-chart-title">🎭 Media Type Performance</div>', unsafe_allow_html=True)
-        
-        if 'media_type' in data.columns and 'likes' in data.columns:
-            media_performance = data.groupby('media_type').agg({
-                'likes': 'mean',
-                'comments': 'mean' if 'comments' in data.columns else 'count',
-                'shares': 'mean' if 'shares' in data.columns else 'count'
-            }).round(0).reset_index()
-            
-            fig = px.bar(media_performance, x='media_type', y=['likes', 'comments', 'shares'],
-                         barmode='group',
-                         color_discrete_map={'likes': '#6366f1', 'comments': '#f093fb', 'shares': '#10b981'})
-            
-            fig.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-                xaxis_title="",
-                yaxis_title="Avg Engagement"
-            )
-            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
-            
-            best_type = media_performance.loc[media_performance['likes'].idxmax(), 'media_type']
-            st.markdown(f"""
-            <div style="background: rgba(99, 102, 241, 0.05); padding: 0.5rem 1rem; border-radius: 10px; border-left: 3px solid #6366f1;">
-                💡 <b>{best_type}</b> content generates <b>{media_performance['likes'].max():.0f}</b> avg likes.
-            </div>
-            """, unsafe_allow_html=True)
+    for i in range(0, len(_CONTENT_CHARTS), 2):
+        for column, spec in zip(st.columns(2), _CONTENT_CHARTS[i:i + 2]):
+            with column:
+                _render_chart_card(spec, inputs)
 
-        else:
-            st.info("⚠️ Data missing for Media Type analysis. Required columns: 'media_type', 'likes'")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
-        st.markdown('<div class="pro-chart-title">🏆 Top Performing Posts</div>', unsafe_allow_html=True)
-        
-        if all(col in data.columns for col in ['likes', 'comments', 'shares']):
-            data_copy = data.copy()
-            data_copy['total_engagement'] = pd.to_numeric(data_copy['likes'], errors='coerce').fillna(0) + \
-                                           pd.to_numeric(data_copy['comments'], errors='coerce').fillna(0) + \
-                                           pd.to_numeric(data_copy['shares'], errors='coerce').fillna(0)
-                                           
-            top_5 = data_copy.nlargest(5, 'total_engagement')
-            
-            for _, post in top_5.iterrows():
-                cap = str(post['caption'])[:55] + "..." if len(str(post['caption'])) > 55 else str(post['caption'])
-                st.markdown(f"""
-                <div style="display: flex; justify-content: space-between; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #f1f5f9;">
-                    <div style="font-size: 0.9rem; color: #1e293b; font-weight: 500;">{cap}</div>
-                    <div style="font-weight: 700; color: #6366f1;">{int(post['total_engagement']):,}</div>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.info("⚠️ Data missing for Top Posts.")
 
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Row 2: Hashtag Analysis
-    col3, col4 = st.columns(2)
+# ==================== 2. Audience Insights ====================
+@st.cache_data(show_spinner=False)
+def _gender_distribution_fig(gender_dist):
+    """Cached audience gender donut as figure JSON"""
+    fig = px.pie(values=gender_dist.values, names=gender_dist.index, 
+                 hole=0.6,
+                 color_discrete_sequence=['#6366f1', '#f093fb', '#94a3b8'])
     
-    with col3:
-        st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
-        st.markdown('<div class="pro-chart-title">🏷️ Top Hashtags by Engagement</div>', unsafe_allow_html=True)
-        
-        if 'hashtags' in data.columns and 'likes' in data.columns:
-            # Process hashtags data
-            all_hashtags = []
-            for idx, row in data.iterrows():
-                if pd.notna(row['hashtags']):
-                    tags = str(row['hashtags']).split(',')
-                    for tag in tags:
-                        tag = tag.strip().lower()
-                        if tag:
-                            all_hashtags.append({'hashtag': tag, 'likes': row['likes'], 'reach': row.get('reach', 0)})
-            
-            if all_hashtags:  # Check if we have hashtag data
-                hashtag_df = pd.DataFrame(all_hashtags)
-                hashtag_summary = hashtag_df.groupby('hashtag').agg({
-                    'likes': 'sum',
-                    'reach': 'sum'
-                }).reset_index()  # type: ignore
-                hashtag_summary['count'] = hashtag_df.groupby('hashtag').size().values
-                
-                if len(hashtag_summary) > 0:  # Now check if we have summary data
-                    top_10 = hashtag_summary.nlargest(10, 'likes')
-                    
-                    fig = px.scatter(
-                        top_10,
-                        x='count',
-                        y='likes',
-                        size='reach',
-                        color='likes',
-                        text='hashtag',
-                        color_continuous_scale=['#667eea', '#764ba2', '#f093fb']
-                    )
-                    
-                    fig.update_traces(textposition='top center')
-                    fig.update_layout(
-                        template='plotly_white',
-                        height=300,
-                        margin=dict(l=0, r=0, t=10, b=0),
-                        xaxis_title="Hashtag Frequency",
-                        yaxis_title="Total Likes"
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        height=300,
+        margin=dict(l=0, r=0, t=10, b=0),
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.1, xanchor="center", x=0.5)
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _hourly_activity_fig(hourly_activity):
+    """Cached posts-per-hour strip heatmap as figure JSON"""
+    fig = go.Figure(data=[go.Heatmap(
+        z=[hourly_activity],
+        x=np.arange(24),
+        y=['Activity'],
+        colorscale='Purples',
+        texttemplate="%{z}",
+        textfont={"size": 10}
+    )])
     
-    # 🧮 Top 10 Hashtags by Reach
-    with col4:
-        st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
-        st.markdown('<div class="pro-chart-title">🧮 Top 10 Hashtags by Reach</div>', unsafe_allow_html=True)
-        
-        if 'hashtags' in data.columns and 'reach' in data.columns:
-            # Process hashtags data
-            all_hashtags = []
-            for idx, row in data.iterrows():
-                if pd.notna(row['hashtags']):
-                    tags = str(row['hashtags']).split(',')
-                    for tag in tags:
-                        tag = tag.strip().lower()
-                        if tag:
-                            all_hashtags.append({'hashtag': tag, 'likes': row['likes'], 'reach': row.get('reach', 0)})
-            
-            if all_hashtags:  # Check if we have hashtag data
-                hashtag_df = pd.DataFrame(all_hashtags)
-                hashtag_summary = hashtag_df.groupby('hashtag').agg({
-                    'likes': 'sum',
-                    'reach': 'sum'
-                }).reset_index()  # type: ignore
-                hashtag_summary['count'] = hashtag_df.groupby('hashtag').size().values
-                
-                if len(hashtag_summary) > 0:  # Now check if we have summary data
-                    top_10 = hashtag_summary.nlargest(10, 'reach')
-                    
-                    fig = px.bar(
-                        top_10,
-                        x='reach',
-                        y='hashtag',
-                        orientation='h',
-                        color='reach',
-                        color_continuous_scale=['#667eea', '#764ba2', '#f093fb'],
-                        text='reach'
-                    )
-                    
-                    fig.update_traces(texttemplate='%{text:,.0f}', textposition='outside')
-                    fig.update_layout(
-                        template='plotly_white',
-                        height=350,
-                        margin=dict(l=0, r=0, t=10, b=0),
-                        showlegend=False
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=150,
+        xaxis_title="Hour of Day"
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _follower_growth_fig(follower_growth):
+    """Cached weekly follower count line as figure JSON"""
+    follower_x, follower_y = _downsample_series(follower_growth.index, follower_growth.values)
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=follower_x,
+        y=follower_y,
+        mode='lines+markers',
+        name='Followers',
+        line=dict(color='#667eea', width=3),
+        marker=dict(size=6)
+    ))
     
-    # Additional Content Performance Charts
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title='Date',
+        yaxis_title='Follower Count'
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _engagement_rate_fig(daily_metrics):
+    """Cached daily engagement rate line as figure JSON"""
+    er_x, er_y = _downsample_series(daily_metrics['date'], daily_metrics['engagement_rate'])
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=er_x,
+        y=er_y,
+        mode='lines+markers',
+        name='Engagement Rate',
+        line=dict(color='#10b981', width=3),
+        marker=dict(size=6)
+    ))
     
-    # Row 3: Content Length Analysis & Posting Frequency Analysis
-    col5, col6 = st.columns(2)
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title='Date',
+        yaxis_title='Engagement Rate (%)'
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _age_distribution_fig(age_dist):
+    """Cached posts per audience age group bars as figure JSON"""
+    fig = px.bar(
+        x=age_dist.index,
+        y=age_dist.values,
+        color=age_dist.values,
+        color_continuous_scale=['#667eea', '#764ba2', '#f093fb']
+    )
     
-    with col5:
-        st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
-        st.markdown('<div class="pro-chart-title">📝 Content Length Impact</div>', unsafe_allow_html=True)
-        
-        if 'caption' in data.columns and 'likes' in data.columns:
-            # Calculate caption length and group for analysis
-            data_caption = data.copy()
-            data_caption['caption_length'] = data_caption['caption'].astype(str).str.len()
-            
-            # Create length groups
-            bins = [0, 50, 100, 150, 200, 500]
-            labels = ['0-50', '51-100', '101-150', '151-200', '200+']
-            data_caption['length_group'] = pd.cut(data_caption['caption_length'], bins=bins, labels=labels, right=False)
-            
-            length_performance = data_caption.groupby('length_group').agg({
-                'likes': 'mean',
-                'comments': 'mean' if 'comments' in data.columns else 'count',
-                'shares': 'mean' if 'shares' in data.columns else 'count'
-            }).round(1)
-            
-            fig_length = go.Figure()
-            fig_length.add_trace(go.Bar(name='Avg Likes', x=length_performance.index, y=length_performance['likes'],
-                                       marker_color='#667eea'))
-            if 'comments' in data.columns:
-                fig_length.add_trace(go.Bar(name='Avg Comments', x=length_performance.index, y=length_performance['comments'],
-                                           marker_color='#f093fb'))
-            if 'shares' in data.columns:
-                fig_length.add_trace(go.Bar(name='Avg Shares', x=length_performance.index, y=length_performance['shares'],
-                                           marker_color='#10b981'))
-            
-            fig_length.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                barmode='group',
-                xaxis_title='Caption Length (characters)',
-                yaxis_title='Average Engagement'
-            )
-            st.plotly_chart(fig_length, use_container_width=True)
-            
-            # Best length insight
-            best_length = length_performance['likes'].idxmax()
-            best_likes = length_performance['likes'].max()
-            st.markdown(f"💡 Optimal caption length: **{best_length}** chars ({best_likes:.1f} avg likes)")
-        else:
-            st.info("⚠️ Data missing for Content Length analysis. Required: 'caption', 'likes'")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+    fig.update_traces(texttemplate='%{y:,}', textposition='outside')
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        showlegend=False,
+        xaxis_title="Age Group",
+        yaxis_title="Count"
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _location_distribution_fig(location_dist):
+    """Cached posts per location horizontal bars as figure JSON"""
+    fig = go.Figure(data=[go.Bar(
+        x=location_dist.values,
+        y=location_dist.index,
+        orientation='h',
+        marker_color='#667eea',
+        texttemplate='%{x:,}',
+        textposition='outside'
+    )])
     
-    with col6:
-        st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
-        st.markdown('<div class="pro-chart-title">📊 Posting Frequency Analysis</div>', unsafe_allow_html=True)
-        
-        if 'timestamp' in data.columns:
-            # Daily posting frequency
-            daily_posts = data.groupby(pd.Grouper(key='timestamp', freq='D')).size()
-            
-            fig_freq = go.Figure()
-            fig_freq.add_trace(go.Scatter(
-                x=daily_posts.index,
-                y=daily_posts.values,
-                mode='lines+markers',
-                name='Posts per Day',
-                line=dict(color='#667eea', width=3),
-                marker=dict(size=6)
-            ))
-            
-            fig_freq.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title='Date',
-                yaxis_title='Number of Posts'
-            )
-            st.plotly_chart(fig_freq, use_container_width=True)
-            
-            # Frequency insights
-            avg_frequency = daily_posts.mean()
-            max_frequency = daily_posts.max()
-            st.markdown(f"📊 Average: **{avg_frequency:.1f}** posts/day")
-            st.markdown(f"📈 Peak: **{max_frequency}** posts/day")
-        else:
-            st.info("⚠️ Data missing for Frequency analysis. Required: 'timestamp'")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title="Follower Count"
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _growth_rate_fig(growth_rate):
+    """Cached daily follower growth rate line as figure JSON"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=growth_rate.index,
+        y=growth_rate.values,
+        mode='lines+markers',
+        name='Growth Rate',
+        line=dict(color='#10b981', width=3),
+        marker=dict(size=6)
+    ))
     
-    # Row 4: Engagement Rate by Content Type & Saves Analysis
-    col9, col10 = st.columns(2)
+    fig.add_hline(y=0, line_dash="dash", line_color="#64748b")
     
-    # 📊 Engagement Rate by Content Type
-    with col9:
-        st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
-        st.markdown('<div class="pro-chart-title">📊 Engagement Rate by Content Type</div>', unsafe_allow_html=True)
-        
-        if all(col in data.columns for col in ['media_type', 'likes', 'impressions']) and len(data) > 0:
-            # Calculate engagement rate by content type
-            data_er_type = data.copy()
-            # Ensure numeric data types
-            data_er_type['likes'] = pd.to_numeric(data_er_type['likes'], errors='coerce').fillna(0)
-            data_er_type['impressions'] = pd.to_numeric(data_er_type['impressions'], errors='coerce').fillna(0)
-            
-            # Group by media type and calculate engagement rate
-            type_metrics = data_er_type.groupby('media_type').agg({
-                'likes': 'sum',
-                'impressions': 'sum'
-            }).reset_index()
-            
-            # Calculate engagement rate (avoid division by zero)
-            type_metrics['engagement_rate'] = np.where(
-                type_metrics['impressions'] > 0,
-                (type_metrics['likes'] / type_metrics['impressions']) * 100,
-                0
-            )
-            
-            fig_er_type = px.bar(
-                type_metrics,
-                x='media_type',
-                y='engagement_rate',
-                color='engagement_rate',
-                color_continuous_scale=['#667eea', '#764ba2', '#f093fb'],
-                text=type_metrics['engagement_rate'].round(2)
-            )
-            
-            fig_er_type.update_traces(texttemplate='%{text}%', textposition='outside')
-            fig_er_type.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                showlegend=False,
-                xaxis_title="Content Type",
-                yaxis_title="Engagement Rate (%)"
-            )
-            st.plotly_chart(fig_er_type, use_container_width=True)
-            
-            # Best content type insight
-            if not type_metrics.empty:
-                best_type = type_metrics.loc[type_metrics['engagement_rate'].idxmax(), 'media_type']
-                best_rate = type_metrics['engagement_rate'].max()
-                st.markdown(f"💡 **{best_type}** has highest engagement rate at {best_rate:.2f}%")
-        else:
-            st.info("⚠️ Data missing for Engagement Rate analysis. Required: 'media_type', 'likes', 'impressions'")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title="Date",
+        yaxis_title="Growth Rate (%)")
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _gender_engagement_fig(gender_engagement):
+    """Cached mean engagement per audience gender grouped bars as figure JSON"""
+    # Melt for visualization
+    melted_gender = gender_engagement.reset_index().melt(
+        id_vars=['audience_gender'],
+        value_vars=['likes', 'comments', 'shares'],
+        var_name='metric',
+        value_name='average'
+    )
     
-    # 💾 Saves Analysis
-    with col10:
-        st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
-        st.markdown('<div class="pro-chart-title">💾 Saves Analysis</div>', unsafe_allow_html=True)
-        
-        if 'saves' in data.columns and 'media_type' in data.columns:
-            # Ensure numeric data type
-            data['saves'] = pd.to_numeric(data['saves'], errors='coerce').fillna(0)
-            
-            # Group by media type
-            saves_by_type = data.groupby('media_type')['saves'].mean().round(1)
-            
-            fig_saves = px.bar(
-                x=saves_by_type.index,
-                y=saves_by_type.values,
-                color=saves_by_type.values,
-                color_continuous_scale=['#10b981', '#667eea', '#f093fb'],
-                text=saves_by_type.values
-            )
-            
-            fig_saves.update_traces(textposition='outside')
-            fig_saves.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                showlegend=False,
-                xaxis_title="Content Type",
-                yaxis_title="Average Saves"
-            )
-            st.plotly_chart(fig_saves, use_container_width=True)
-            
-            # Best saving content insight
-            if not saves_by_type.empty:
-                best_saving_type = saves_by_type.idxmax()
-                avg_saves = saves_by_type.max()
-                st.markdown(f"💾 **{best_saving_type}** gets {avg_saves:.1f} avg saves per post")
-        else:
-            st.info("⚠️ Data missing for Saves analysis. Required: 'saves', 'media_type'")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+    fig = px.bar(
+        melted_gender,
+        x='audience_gender',
+        y='average',
+        color='metric',
+        barmode='group',
+        color_discrete_sequence=['#667eea', '#f093fb', '#10b981']
+    )
     
-    # Row 5: Engagement Correlation Matrix & Content Type Comparison
-    col7, col8 = st.columns(2)
+    fig.update_traces(texttemplate='%{y:,}', textposition='outside')
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title="Gender",
+        yaxis_title="Average Engagement",
+        showlegend=True
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _location_engagement_fig(top_locations):
+    """Cached total engagement per location horizontal bars as figure JSON"""
+    fig = px.bar(
+        top_locations,
+        x='total_engagement',
+        y='location',
+        orientation='h',
+        color='total_engagement',
+        color_continuous_scale=['#667eea', '#764ba2', '#f093fb']
+    )
     
-    with col7:
-        st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
-        st.markdown('<div class="pro-chart-title">🔗 Engagement Correlation</div>', unsafe_allow_html=True)
-        
-        if all(col in data.columns for col in ['likes', 'comments', 'shares']):
-            # Create correlation matrix
-            corr_data = data[['likes', 'comments', 'shares']].corr()
-            
-            fig_corr = go.Figure(data=go.Heatmap(
-                z=corr_data.values,
-                x=corr_data.columns,
-                y=corr_data.index,
-                colorscale='RdBu',
-                text=corr_data.values.round(2),
-                texttemplate="%{text}",
-                textfont={"size": 12}
-            ))
-            
-            fig_corr.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title="Metrics",
-                yaxis_title="Metrics"
-            )
-            st.plotly_chart(fig_corr, use_container_width=True)
-            
-            # Correlation insights
-            likes_comments_corr = corr_data.loc['likes', 'comments']
-            if abs(likes_comments_corr) > 0.7:
-                st.markdown(f"🔗 Strong correlation between likes and comments (**{likes_comments_corr:.2f}**)")
-            elif abs(likes_comments_corr) > 0.4:
-                st.markdown(f"🔗 Moderate correlation between likes and comments (**{likes_comments_corr:.2f}**)")
-            else:
-                st.markdown(f"🔗 Weak correlation between likes and comments (**{likes_comments_corr:.2f}**)")
-        else:
-            st.info("⚠️ Data missing for Correlation analysis. Required: 'likes', 'comments', 'shares'")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+    fig.update_traces(texttemplate='%{x:,.0f}', textposition='outside')
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        showlegend=False,
+        xaxis_title="Total Engagement",
+        yaxis_title="Location"
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _gender_age_fig(cross_tab):
+    """Cached gender x age post-count heatmap as figure JSON"""
+    fig = go.Figure(data=go.Heatmap(
+        z=cross_tab.values,
+        x=cross_tab.columns,
+        y=cross_tab.index,
+        colorscale='Blues',
+        texttemplate="%{z}",
+        textfont={"size": 10}
+    ))
     
-    with col8:
-        st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
-        st.markdown('<div class="pro-chart-title">⚖️ Content Type Comparison</div>', unsafe_allow_html=True)
-        
-        if 'media_type' in data.columns and 'likes' in data.columns:
-            # Compare different content types
-            content_comparison = data.groupby('media_type').agg({
-                'likes': ['mean', 'std'],
-                'comments': ['mean', 'std'] if 'comments' in data.columns else ['count', 'count'],
-                'shares': ['mean', 'std'] if 'shares' in data.columns else ['count', 'count']
-            })
-            
-            # Flatten column names
-            content_comparison.columns = ['_'.join(col).strip() for col in content_comparison.columns.values]
-            content_comparison = content_comparison.reset_index()
-            
-            # Melt for visualization
-            melted_data = content_comparison.melt(id_vars=['media_type'], 
-                                                value_vars=[col for col in content_comparison.columns if 'mean' in col],
-                                                var_name='metric', 
-                                                value_name='average')
-            melted_data['metric'] = melted_data['metric'].str.replace('_mean', '')
-            
-            fig_compare = px.bar(melted_data, 
-                               x='media_type', 
-                               y='average', 
-                               color='metric',
-                               barmode='group',
-                               color_discrete_sequence=['#667eea', '#f093fb', '#10b981'])
-            
-            fig_compare.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title="Content Type",
-                yaxis_title="Average Engagement"
-            )
-            st.plotly_chart(fig_compare, use_container_width=True)
-        else:
-            st.info("⚠️ Data missing for Content Type comparison. Required: 'media_type', 'likes'")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title="Age Group",
+        yaxis_title="Gender"
+    )
+    return fig.to_json()
 
 
-# ==================== 2. Audience Insights ====================
 def render_audience_insights(data):
     """Audience Insights with Clear Visuals"""
     from professional_dashboard import render_professional_header
     render_professional_header("👥 Audience Insights", "Understand followers and their activity patterns")
+    
+    # Parse timestamps at most once for every chart in this section
+    cols = frozenset(data.columns)
+    ts = _timestamps(data) if 'timestamp' in cols else None
+    has_followers = {'timestamp', 'follower_count'} <= cols
 
     
     # Add AI recommendations for optimal posting times
@@ -485,22 +998,11 @@ def render_audience_insights(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">🧍‍♂️🧍‍♀️ Gender Distribution</div>', unsafe_allow_html=True)
         
-        if 'audience_gender' in data.columns:
+        if 'audience_gender' in cols:
             gender_dist = data['audience_gender'].value_counts()
             
-            fig = px.pie(values=gender_dist.values, names=gender_dist.index, 
-                         hole=0.6,
-                         color_discrete_sequence=['#6366f1', '#f093fb', '#94a3b8'])
-            
-            fig.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                showlegend=True,
-                legend=dict(orientation="h", yanchor="bottom", y=-0.1, xanchor="center", x=0.5)
-            )
-            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+            st.plotly_chart(pio.from_json(_gender_distribution_fig(gender_dist)), use_container_width=True,
+                            config={'displayModeBar': False})
 
         
         st.markdown('</div>', unsafe_allow_html=True)
@@ -510,35 +1012,16 @@ def render_audience_insights(data):
         st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">🕓 Active Users by Hour</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns:
-            data['hour'] = pd.to_datetime(data['timestamp']).dt.hour
-            hourly_activity = data.groupby('hour').size()
-            
-            fig = go.Figure(data=[go.Heatmap(
-                z=[hourly_activity.values],
-                x=hourly_activity.index,
-                y=['Activity'],
-                colorscale='Purples',
-                text=[hourly_activity.values],
-                texttemplate="%{text}",
-                textfont={"size": 10}
-            )])
+        if 'timestamp' in cols:
+            hourly_activity = np.bincount(_hours(data, ts), minlength=24)
             
-            fig.update_layout(
-                template='plotly_white',
-                height=150,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title="Hour of Day"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(pio.from_json(_hourly_activity_fig(hourly_activity)), use_container_width=True)
             
             # Best hour insight
-            best_hour = hourly_activity.idxmax()
-            am_pm = "AM" if best_hour < 12 else "PM"
-            hour_12 = best_hour if best_hour <= 12 else best_hour - 12
+            best_hour = int(hourly_activity.argmax())
             
             st.markdown('<div class="pro-insights">', unsafe_allow_html=True)
-            st.markdown(f'💡 <strong>Most followers active at {hour_12}:00 {am_pm}</strong>', unsafe_allow_html=True)
+            st.markdown(f'💡 <strong>Most followers active at {HOUR_LABELS[best_hour]}</strong>', unsafe_allow_html=True)
             st.markdown('</div>', unsafe_allow_html=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
@@ -552,28 +1035,11 @@ def render_audience_insights(data):
         st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">📈 Follower Growth Over Time</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'follower_count' in data.columns:
-            # Resample to weekly data for smoother visualization
-            follower_growth = data.set_index('timestamp').resample('W')['follower_count'].last().dropna()
+        if has_followers:
+            # Resample the shared daily closing counts to weekly data for smoother visualization
+            follower_growth = _time_aggregates(_fingerprint(data), data)['daily']['follower_count'].resample('W').last().dropna()
             
-            fig_follower = go.Figure()
-            fig_follower.add_trace(go.Scatter(
-                x=follower_growth.index,
-                y=follower_growth.values,
-                mode='lines+markers',
-                name='Followers',
-                line=dict(color='#667eea', width=3),
-                marker=dict(size=6)
-            ))
-            
-            fig_follower.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title='Date',
-                yaxis_title='Follower Count'
-            )
-            st.plotly_chart(fig_follower, use_container_width=True)
+            st.plotly_chart(pio.from_json(_follower_growth_fig(follower_growth)), use_container_width=True)
             
             # Growth insights
             if len(follower_growth) > 1:
@@ -588,14 +1054,9 @@ def render_audience_insights(data):
         st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">⚡ Engagement Rate by Day</div>', unsafe_allow_html=True)
         
-        if all(col in data.columns for col in ['timestamp', 'likes', 'impressions']) and len(data) > 0:
+        if {'timestamp', 'likes', 'impressions'} <= cols and len(data) > 0:
             # Calculate daily engagement rate
-            data_er = data.copy()
-            data_er['date'] = pd.to_datetime(data_er['timestamp']).dt.date
-            daily_metrics = data_er.groupby('date').agg({
-                'likes': 'sum',
-                'impressions': 'sum'
-            }).reset_index()
+            daily_metrics = _sum_by(ts.dt.date, data[['likes', 'impressions']], 'date')
             
             # Calculate engagement rate (avoid division by zero)
             daily_metrics['engagement_rate'] = np.where(
@@ -604,24 +1065,7 @@ def render_audience_insights(data):
                 0
             )
             
-            fig_er = go.Figure()
-            fig_er.add_trace(go.Scatter(
-                x=daily_metrics['date'],
-                y=daily_metrics['engagement_rate'],
-                mode='lines+markers',
-                name='Engagement Rate',
-                line=dict(color='#10b981', width=3),
-                marker=dict(size=6)
-            ))
-            
-            fig_er.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title='Date',
-                yaxis_title='Engagement Rate (%)'
-            )
-            st.plotly_chart(fig_er, use_container_width=True)
+            st.plotly_chart(pio.from_json(_engagement_rate_fig(daily_metrics)), use_container_width=True)
             
             # Average engagement rate
             avg_er = daily_metrics['engagement_rate'].mean()
@@ -639,27 +1083,10 @@ def render_audience_insights(data):
         st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">📊 Audience Age Groups</div>', unsafe_allow_html=True)
         
-        if 'audience_age' in data.columns:
+        if 'audience_age' in cols:
             age_dist = data['audience_age'].value_counts().sort_index()
             
-            fig = px.bar(
-                x=age_dist.index,
-                y=age_dist.values,
-                color=age_dist.values,
-                color_continuous_scale=['#667eea', '#764ba2', '#f093fb'],
-                text=age_dist.values
-            )
-            
-            fig.update_traces(textposition='outside')
-            fig.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                showlegend=False,
-                xaxis_title="Age Group",
-                yaxis_title="Count"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(pio.from_json(_age_distribution_fig(age_dist)), use_container_width=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -668,25 +1095,10 @@ def render_audience_insights(data):
         st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">🌍 Top Locations</div>', unsafe_allow_html=True)
         
-        if 'location' in data.columns:
+        if 'location' in cols:
             location_dist = data['location'].value_counts().head(10)
             
-            fig = go.Figure(data=[go.Bar(
-                x=location_dist.values,
-                y=location_dist.index,
-                orientation='h',
-                marker_color='#667eea',
-                text=location_dist.values,
-                textposition='outside'
-            )])
-            
-            fig.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title="Follower Count"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(pio.from_json(_location_distribution_fig(location_dist)), use_container_width=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -698,47 +1110,16 @@ def render_audience_insights(data):
         st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">👥 Audience Engagement by Gender</div>', unsafe_allow_html=True)
         
-        if all(col in data.columns for col in ['audience_gender', 'likes', 'comments', 'shares']):
+        if {'audience_gender', 'likes', 'comments', 'shares'} <= cols:
             # Group by gender and calculate average engagement
-            gender_engagement = data.groupby('audience_gender').agg({
-                'likes': 'mean',
-                'comments': 'mean',
-                'shares': 'mean'
-            }).round(1)
+            gender_engagement = _engagement_by(data[['audience_gender', *ENGAGEMENT_COLUMNS]], 'audience_gender', 'mean').round(1)
             
-            # Melt for visualization
-            melted_gender = gender_engagement.reset_index().melt(
-                id_vars=['audience_gender'],
-                value_vars=['likes', 'comments', 'shares'],
-                var_name='metric',
-                value_name='average'
-            )
-            
-            fig_gender = px.bar(
-                melted_gender,
-                x='audience_gender',
-                y='average',
-                color='metric',
-                barmode='group',
-                color_discrete_sequence=['#667eea', '#f093fb', '#10b981'],
-                text='average'
-            )
-            
-            fig_gender.update_traces(texttemplate='%{text}', textposition='outside')
-            fig_gender.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title="Gender",
-                yaxis_title="Average Engagement",
-                showlegend=True
-            )
-            st.plotly_chart(fig_gender, use_container_width=True)
+            st.plotly_chart(pio.from_json(_gender_engagement_fig(gender_engagement)), use_container_width=True)
             
             # Best performing gender insight
             if not gender_engagement.empty:
-                best_gender = gender_engagement['likes'].idxmax()
-                best_likes = gender_engagement['likes'].max()
+                i, best_likes = _peak(gender_engagement['likes'])
+                best_gender = gender_engagement.index[i]
                 st.markdown(f"💡 **{best_gender}** audience generates {best_likes:.1f} avg likes per post")
         else:
             st.info("⚠️ Data missing for Gender Engagement analysis. Required: 'audience_gender', 'likes', 'comments', 'shares'")
@@ -750,13 +1131,9 @@ def render_audience_insights(data):
         st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">🌍 Top Locations by Engagement</div>', unsafe_allow_html=True)
         
-        if all(col in data.columns for col in ['location', 'likes', 'comments', 'shares']):
+        if {'location', 'likes', 'comments', 'shares'} <= cols:
             # Group by location and calculate total engagement
-            location_engagement = data.groupby('location').agg({
-                'likes': 'sum',
-                'comments': 'sum',
-                'shares': 'sum'
-            }).reset_index()
+            location_engagement = _engagement_by(data[['location', *ENGAGEMENT_COLUMNS]], 'location', 'sum').reset_index()
             
             # Calculate total engagement
             location_engagement['total_engagement'] = (
@@ -765,29 +1142,10 @@ def render_audience_insights(data):
                 location_engagement['shares']
             )
             
-            # Get top 10 locations
-            top_locations = location_engagement.nlargest(10, 'total_engagement')
+            # Get top 10 locations with a partial sort
+            top_locations = location_engagement.iloc[_top_k(location_engagement['total_engagement'].to_numpy(), 10)]
             
-            fig_location = px.bar(
-                top_locations,
-                x='total_engagement',
-                y='location',
-                orientation='h',
-                color='total_engagement',
-                color_continuous_scale=['#667eea', '#764ba2', '#f093fb'],
-                text='total_engagement'
-            )
-            
-            fig_location.update_traces(texttemplate='%{text:,.0f}', textposition='outside')
-            fig_location.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                showlegend=False,
-                xaxis_title="Total Engagement",
-                yaxis_title="Location"
-            )
-            st.plotly_chart(fig_location, use_container_width=True)
+            st.plotly_chart(pio.from_json(_location_engagement_fig(top_locations)), use_container_width=True)
             
             # Best performing location insight
             if not top_locations.empty:
@@ -807,28 +1165,11 @@ def render_audience_insights(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">👥 Gender-Age Cross Analysis</div>', unsafe_allow_html=True)
         
-        if 'audience_gender' in data.columns and 'audience_age' in data.columns:
+        if {'audience_gender', 'audience_age'} <= cols:
             # Create cross-tabulation
-            cross_tab = pd.crosstab(data['audience_gender'], data['audience_age'])
-            
-            fig_cross = go.Figure(data=go.Heatmap(
-                z=cross_tab.values,
-                x=cross_tab.columns,
-                y=cross_tab.index,
-                colorscale='Blues',
-                text=cross_tab.values,
-                texttemplate="%{text}",
-                textfont={"size": 10}
-            ))
+            cross_tab = _gender_age_crosstab(data[['audience_gender', 'audience_age']])
             
-            fig_cross.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title="Age Group",
-                yaxis_title="Gender"
-            )
-            st.plotly_chart(fig_cross, use_container_width=True)
+            st.plotly_chart(pio.from_json(_gender_age_fig(cross_tab)), use_container_width=True)
         else:
             st.info("⚠️ Data missing for Gender-Age analysis. Required: 'audience_gender', 'audience_age'")
         
@@ -839,35 +1180,15 @@ def render_audience_insights(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">📈 Follower Growth Rate</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'follower_count' in data.columns:
-            # Calculate daily growth rate
-            data_growth = data.copy()
-            data_growth['timestamp'] = pd.to_datetime(data_growth['timestamp'])
-            daily_followers = data_growth.groupby(pd.Grouper(key='timestamp', freq='D'))['follower_count'].last().dropna()
+        if has_followers:
+            # Daily closing follower counts from the daily table shared with the time-based sections
+            daily_followers = _time_aggregates(_fingerprint(data), data)['daily']['follower_count'].dropna()
             
             if len(daily_followers) > 1:
                 # Calculate percentage change
-                growth_rate = daily_followers.pct_change() * 100
-                
-                fig_growth = go.Figure()
-                fig_growth.add_trace(go.Scatter(
-                    x=growth_rate.index,
-                    y=growth_rate.values,
-                    mode='lines+markers',
-                    name='Growth Rate',
-                    line=dict(color='#10b981', width=3),
-                    marker=dict(size=6)
-                ))
+                growth_rate = pd.Series(_pct_growth(daily_followers.to_numpy()), index=daily_followers.index)
                 
-                fig_growth.add_hline(y=0, line_dash="dash", line_color="#64748b")
-                
-                fig_growth.update_layout(
-                    template='plotly_white',
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    xaxis_title="Date",
-                    yaxis_title="Growth Rate (%)")
-                st.plotly_chart(fig_growth, use_container_width=True)
+                st.plotly_chart(pio.from_json(_growth_rate_fig(growth_rate)), use_container_width=True)
                 
                 # Growth insights
                 avg_growth = growth_rate.mean()
@@ -881,11 +1202,187 @@ def render_audience_insights(data):
 
 
 # ==================== 3. Time-Based Trends ====================
+@st.cache_data(show_spinner=False)
+def _daily_engagement_fig(daily_engagement):
+    """Cached daily likes/comments area chart as figure JSON"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=daily_engagement.index,
+        y=daily_engagement['likes'],
+        name='Likes',
+        line=dict(color='#667eea', width=3),
+        fill='tozeroy',
+        fillcolor='rgba(102, 126, 234, 0.2)'
+    ))
+    
+    if 'comments' in daily_engagement.columns:
+        fig.add_trace(go.Scatter(
+            x=daily_engagement.index,
+            y=daily_engagement['comments'],
+            name='Comments',
+            line=dict(color='#f093fb', width=3),
+            fill='tozeroy',
+            fillcolor='rgba(240, 147, 251, 0.2)'
+        ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        hovermode='x unified'
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _weekly_heatmap_fig(heatmap_data):
+    """Cached weekday x hour mean-likes heatmap as figure JSON"""
+    fig = go.Figure(data=go.Heatmap(
+        z=heatmap_data.values,
+        x=heatmap_data.columns,
+        y=heatmap_data.index,
+        colorscale='Viridis',
+        texttemplate='%{z:.0f}',
+        textfont={"size": 8}
+    ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title="Hour of Day",
+        yaxis_title="Day of Week"
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _hourly_engagement_fig(hourly_engagement):
+    """Cached mean likes/comments per hour line chart as figure JSON"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=hourly_engagement.index,
+        y=hourly_engagement['likes'],
+        name='Likes',
+        line=dict(color='#667eea', width=3),
+        mode='lines+markers',
+        fill='tozeroy',
+        fillcolor='rgba(102, 126, 234, 0.2)'
+    ))
+    
+    if 'comments' in hourly_engagement.columns:
+        fig.add_trace(go.Scatter(
+            x=hourly_engagement.index,
+            y=hourly_engagement['comments'],
+            name='Comments',
+            line=dict(color='#f093fb', width=3),
+            mode='lines+markers',
+            fill='tozeroy',
+            fillcolor='rgba(240, 147, 251, 0.2)'
+        ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title='Hour of Day (24-hour)',
+        yaxis_title='Average Engagement',
+        hovermode='x unified'
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _dow_engagement_fig(dow_engagement):
+    """Cached mean likes/comments per weekday bar chart as figure JSON"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=dow_engagement.index,
+        y=dow_engagement['likes'],
+        name='Likes',
+        marker_color='#667eea',
+        texttemplate='%{y:,}',
+        textposition='outside'
+    ))
+    
+    if 'comments' in dow_engagement.columns:
+        fig.add_trace(go.Bar(
+            x=dow_engagement.index,
+            y=dow_engagement['comments'],
+            name='Comments',
+            marker_color='#f093fb',
+            texttemplate='%{y:,}',
+            textposition='outside'
+        ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title='Day of Week',
+        yaxis_title='Average Engagement',
+        barmode='group'
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _monthly_trend_fig(monthly_trend):
+    """Cached monthly likes/comments totals line chart as figure JSON"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=monthly_trend['month_str'],
+        y=monthly_trend['likes'],
+        name='Likes',
+        line=dict(color='#667eea', width=3),
+        mode='lines+markers'
+    ))
+    
+    if 'comments' in monthly_trend.columns:
+        fig.add_trace(go.Scatter(
+            x=monthly_trend['month_str'],
+            y=monthly_trend['comments'],
+            name='Comments',
+            line=dict(color='#f093fb', width=3),
+            mode='lines+markers'
+        ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title="Month",
+        yaxis_title="Engagement Count",
+        hovermode='x unified'
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _seasonal_fig(seasonal_performance):
+    """Cached mean likes per season bar chart as figure JSON"""
+    fig = go.Figure(data=[go.Bar(
+        x=seasonal_performance.index,
+        y=seasonal_performance['likes'],
+        marker_color=['#667eea', '#10b981', '#fbbf24', '#ef4444'],
+        texttemplate='%{y:,}',
+        textposition='outside'
+    )])
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title="Season",
+        yaxis_title="Average Likes"
+    )
+    return fig.to_json()
+
+
 def render_time_based_trends(data):
     """Analyze temporal patterns and trends in social media performance"""
     from professional_dashboard import render_professional_header
     render_professional_header("⏰ Time-Based Trends", "Temporal patterns and optimal posting times")
-
+    
+    # All six charts read one fused, cached aggregation pass over the parsed trend columns,
+    # and all of them need timestamps and likes
+    cols = frozenset(data.columns)
+    aggs = _time_aggregates(_fingerprint(data), data) if 'timestamp' in cols else None
+    has_likes = {'timestamp', 'likes'} <= cols
     
     col1, col2 = st.columns(2)
     
@@ -894,41 +1391,11 @@ def render_time_based_trends(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">📈 Daily Engagement Trend</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'likes' in data.columns:
-            data['timestamp'] = pd.to_datetime(data['timestamp'])
-            daily_engagement = data.groupby(pd.Grouper(key='timestamp', freq='D')).agg({
-                'likes': 'sum',
-                'comments': 'sum' if 'comments' in data.columns else 'count',
-                'shares': 'sum' if 'shares' in data.columns else 'count'
-            })
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=daily_engagement.index,
-                y=daily_engagement['likes'],
-                name='Likes',
-                line=dict(color='#667eea', width=3),
-                fill='tozeroy',
-                fillcolor='rgba(102, 126, 234, 0.2)'
-            ))
-            
-            if 'comments' in data.columns:
-                fig.add_trace(go.Scatter(
-                    x=daily_engagement.index,
-                    y=daily_engagement['comments'],
-                    name='Comments',
-                    line=dict(color='#f093fb', width=3),
-                    fill='tozeroy',
-                    fillcolor='rgba(240, 147, 251, 0.2)'
-                ))
+        if has_likes:
+            daily_engagement = aggs['daily']
             
-            fig.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                hovermode='x unified'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            # Figures are memoized as JSON on the small aggregate, so reruns skip plotly construction
+            st.plotly_chart(pio.from_json(_daily_engagement_fig(daily_engagement)), use_container_width=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -937,44 +1404,19 @@ def render_time_based_trends(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">📅 Weekly Pattern Analysis</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'likes' in data.columns:
-            data_copy = data.copy()
-            data_copy['timestamp'] = pd.to_datetime(data_copy['timestamp'])
-            data_copy['day_of_week'] = data_copy['timestamp'].dt.day_name()
-            data_copy['hour'] = data_copy['timestamp'].dt.hour
-            
-            # Create pivot table for heatmap
-            heatmap_data = data_copy.pivot_table(values='likes', index='day_of_week', columns='hour', aggfunc='mean', fill_value=0)
-            days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            heatmap_data = heatmap_data.reindex([d for d in days_order if d in heatmap_data.index])
-            
-            fig = go.Figure(data=go.Heatmap(
-                z=heatmap_data.values,
-                x=heatmap_data.columns,
-                y=heatmap_data.index,
-                colorscale='Viridis',
-                text=heatmap_data.values.round(0),
-                texttemplate='%{text}',
-                textfont={"size": 8}
-            ))
+        if has_likes:
+            heatmap_data = aggs['weekly']
             
-            fig.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title="Hour of Day",
-                yaxis_title="Day of Week"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(pio.from_json(_weekly_heatmap_fig(heatmap_data)), use_container_width=True)
             
             # AI Insight
-            best_hour = data_copy.groupby('hour')['likes'].mean().idxmax()
-            am_pm = "AM" if best_hour < 12 else "PM"
-            hour_12 = best_hour if best_hour <= 12 else best_hour - 12
-            
-            st.markdown('<div class="pro-insights">', unsafe_allow_html=True)
-            st.markdown(f'💡 <strong>Posts between {hour_12}:00 {am_pm} have 2× engagement</strong>', unsafe_allow_html=True)
-            st.markdown('</div>', unsafe_allow_html=True)
+            if not aggs['hourly'].empty:
+                i, _ = _peak(aggs['hourly']['likes'])
+                best_hour = int(aggs['hourly'].index[i])
+                
+                st.markdown('<div class="pro-insights">', unsafe_allow_html=True)
+                st.markdown(f'💡 <strong>Posts between {HOUR_LABELS[best_hour]} have 2× engagement</strong>', unsafe_allow_html=True)
+                st.markdown('</div>', unsafe_allow_html=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -986,59 +1428,17 @@ def render_time_based_trends(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">🕒 Hourly Engagement Patterns</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'likes' in data.columns:
-            data_hourly = data.copy()
-            data_hourly['timestamp'] = pd.to_datetime(data_hourly['timestamp'])
-            data_hourly['hour'] = data_hourly['timestamp'].dt.hour
-            
-            # Group by hour and calculate average engagement
-            hourly_engagement = data_hourly.groupby('hour').agg({
-                'likes': 'mean',
-                'comments': 'mean' if 'comments' in data.columns else 'count',
-                'shares': 'mean' if 'shares' in data.columns else 'count'
-            }).round(1)
+        if has_likes:
+            # Average engagement per hour of day
+            hourly_engagement = aggs['hourly'].round(1)
             
-            fig_hourly = go.Figure()
-            fig_hourly.add_trace(go.Scatter(
-                x=hourly_engagement.index,
-                y=hourly_engagement['likes'],
-                name='Likes',
-                line=dict(color='#667eea', width=3),
-                mode='lines+markers',
-                fill='tozeroy',
-                fillcolor='rgba(102, 126, 234, 0.2)'
-            ))
-            
-            if 'comments' in data.columns:
-                fig_hourly.add_trace(go.Scatter(
-                    x=hourly_engagement.index,
-                    y=hourly_engagement['comments'],
-                    name='Comments',
-                    line=dict(color='#f093fb', width=3),
-                    mode='lines+markers',
-                    fill='tozeroy',
-                    fillcolor='rgba(240, 147, 251, 0.2)'
-                ))
-            
-            fig_hourly.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title='Hour of Day (24-hour)',
-                yaxis_title='Average Engagement',
-                hovermode='x unified'
-            )
-            st.plotly_chart(fig_hourly, use_container_width=True)
+            st.plotly_chart(pio.from_json(_hourly_engagement_fig(hourly_engagement)), use_container_width=True)
             
             # Best hour insight
             if not hourly_engagement.empty:
-                best_hour = hourly_engagement['likes'].idxmax()
-                best_likes = hourly_engagement['likes'].max()
-                am_pm = "AM" if best_hour < 12 else "PM"
-                hour_12 = best_hour if best_hour <= 12 else best_hour - 12
-                if best_hour == 0:
-                    hour_12 = 12
-                st.markdown(f"⏰ Peak engagement at **{hour_12}:00 {am_pm}** with {best_likes:.1f} avg likes")
+                i, best_likes = _peak(hourly_engagement['likes'])
+                best_hour = int(hourly_engagement.index[i])
+                st.markdown(f"⏰ Peak engagement at **{HOUR_LABELS[best_hour]}** with {best_likes:.1f} avg likes")
         else:
             st.info("⚠️ Data missing for Hourly analysis. Required: 'timestamp', 'likes'")
         
@@ -1049,56 +1449,16 @@ def render_time_based_trends(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">🗓️ Day-of-Week Engagement Comparison</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'likes' in data.columns:
-            data_dow = data.copy()
-            data_dow['timestamp'] = pd.to_datetime(data_dow['timestamp'])
-            data_dow['day_of_week'] = data_dow['timestamp'].dt.day_name()
-            
-            # Group by day of week and calculate average engagement
-            dow_engagement = data_dow.groupby('day_of_week').agg({
-                'likes': 'mean',
-                'comments': 'mean' if 'comments' in data.columns else 'count',
-                'shares': 'mean' if 'shares' in data.columns else 'count'
-            }).round(1)
-            
-            # Reorder days
-            days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            dow_engagement = dow_engagement.reindex([d for d in days_order if d in dow_engagement.index])
-            
-            fig_dow = go.Figure()
-            fig_dow.add_trace(go.Bar(
-                x=dow_engagement.index,
-                y=dow_engagement['likes'],
-                name='Likes',
-                marker_color='#667eea',
-                text=dow_engagement['likes'],
-                textposition='outside'
-            ))
+        if has_likes:
+            # Average engagement per day of week, Monday first
+            dow_engagement = aggs['dow']
             
-            if 'comments' in data.columns:
-                fig_dow.add_trace(go.Bar(
-                    x=dow_engagement.index,
-                    y=dow_engagement['comments'],
-                    name='Comments',
-                    marker_color='#f093fb',
-                    text=dow_engagement['comments'],
-                    textposition='outside'
-                ))
-            
-            fig_dow.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title='Day of Week',
-                yaxis_title='Average Engagement',
-                barmode='group'
-            )
-            st.plotly_chart(fig_dow, use_container_width=True)
+            st.plotly_chart(pio.from_json(_dow_engagement_fig(dow_engagement)), use_container_width=True)
             
             # Best day insight
             if not dow_engagement.empty:
-                best_day = dow_engagement['likes'].idxmax()
-                best_likes = dow_engagement['likes'].max()
+                i, best_likes = _peak(dow_engagement['likes'])
+                best_day = dow_engagement.index[i]
                 st.markdown(f"📅 Best engagement on **{best_day}** with {best_likes:.1f} avg likes")
         else:
             st.info("⚠️ Data missing for Day-of-Week analysis. Required: 'timestamp', 'likes'")
@@ -1113,46 +1473,10 @@ def render_time_based_trends(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">📅 Monthly Trend Analysis</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'likes' in data.columns:
-            data_monthly = data.copy()
-            data_monthly['timestamp'] = pd.to_datetime(data_monthly['timestamp'])
-            data_monthly['month'] = data_monthly['timestamp'].dt.to_period('M')
-            monthly_trend = data_monthly.groupby('month').agg({
-                'likes': 'sum',
-                'comments': 'sum' if 'comments' in data.columns else 'count',
-                'shares': 'sum' if 'shares' in data.columns else 'count'
-            }).reset_index()
-            
-            # Convert Period to string for plotting
-            monthly_trend['month_str'] = monthly_trend['month'].astype(str)
-            
-            fig_monthly = go.Figure()
-            fig_monthly.add_trace(go.Scatter(
-                x=monthly_trend['month_str'],
-                y=monthly_trend['likes'],
-                name='Likes',
-                line=dict(color='#667eea', width=3),
-                mode='lines+markers'
-            ))
-            
-            if 'comments' in data.columns:
-                fig_monthly.add_trace(go.Scatter(
-                    x=monthly_trend['month_str'],
-                    y=monthly_trend['comments'],
-                    name='Comments',
-                    line=dict(color='#f093fb', width=3),
-                    mode='lines+markers'
-                ))
+        if has_likes:
+            monthly_trend = aggs['monthly']
             
-            fig_monthly.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title="Month",
-                yaxis_title="Engagement Count",
-                hovermode='x unified'
-            )
-            st.plotly_chart(fig_monthly, use_container_width=True)
+            st.plotly_chart(pio.from_json(_monthly_trend_fig(monthly_trend)), use_container_width=True)
         else:
             st.info("⚠️ Data missing for Monthly analysis. Required: 'timestamp', 'likes'")
         
@@ -1163,46 +1487,16 @@ def render_time_based_trends(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">🌞 Seasonal Patterns</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'likes' in data.columns:
-            data_seasonal = data.copy()
-            data_seasonal['timestamp'] = pd.to_datetime(data_seasonal['timestamp'])
-            data_seasonal['season'] = data_seasonal['timestamp'].dt.month.map({
-                12: 'Winter', 1: 'Winter', 2: 'Winter',
-                3: 'Spring', 4: 'Spring', 5: 'Spring',
-                6: 'Summer', 7: 'Summer', 8: 'Summer',
-                9: 'Fall', 10: 'Fall', 11: 'Fall'
-            })
-            seasonal_performance = data_seasonal.groupby('season').agg({
-                'likes': 'mean',
-                'comments': 'mean' if 'comments' in data.columns else 'count',
-                'shares': 'mean' if 'shares' in data.columns else 'count'
-            }).round(1)
-            
-            # Reorder seasons
-            season_order = ['Winter', 'Spring', 'Summer', 'Fall']
-            seasonal_performance = seasonal_performance.reindex([s for s in season_order if s in seasonal_performance.index])
-            
-            fig_seasonal = go.Figure(data=[go.Bar(
-                x=seasonal_performance.index,
-                y=seasonal_performance['likes'],
-                marker_color=['#667eea', '#10b981', '#fbbf24', '#ef4444'],
-                text=seasonal_performance['likes'],
-                textposition='outside'
-            )])
+        if has_likes:
+            seasonal_performance = aggs['seasonal']
             
-            fig_seasonal.update_layout(
-                template='plotly_white',
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis_title="Season",
-                yaxis_title="Average Likes"
-            )
-            st.plotly_chart(fig_seasonal, use_container_width=True)
+            st.plotly_chart(pio.from_json(_seasonal_fig(seasonal_performance)), use_container_width=True)
             
             # Seasonal insights
-            best_season = seasonal_performance['likes'].idxmax()
-            best_likes = seasonal_performance['likes'].max()
-            st.markdown(f"🌤️ **{best_season}** performs best with {best_likes:.0f} avg likes")
+            if not seasonal_performance.empty:
+                i, best_likes = _peak(seasonal_performance['likes'])
+                best_season = seasonal_performance.index[i]
+                st.markdown(f"🌤️ **{best_season}** performs best with {best_likes:.0f} avg likes")
         else:
             st.info("⚠️ Data missing for Seasonal analysis. Required: 'timestamp', 'likes'")
         
@@ -1210,11 +1504,201 @@ def render_time_based_trends(data):
 
 
 # ==================== 4. Predictive Analytics ====================
+@st.cache_data(show_spinner=False)
+def _engagement_forecast_fig(daily_likes, future_y):
+    """Cached daily likes with the 30-day trend-line forecast as figure JSON"""
+    future_dates = pd.date_range(start=daily_likes['timestamp'].iloc[-1] + timedelta(days=1), periods=len(future_y), freq='D')
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=daily_likes['timestamp'],
+        y=daily_likes['likes'],
+        name='Actual',
+        line=dict(color='#667eea', width=3)
+    ))
+    fig.add_trace(go.Scatter(
+        x=future_dates,
+        y=future_y,
+        name='Forecast',
+        line=dict(color='#f093fb', width=3, dash='dash')
+    ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        hovermode='x unified'
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _follower_projection_fig(daily_followers, future_followers):
+    """Cached closing follower counts with the 30-day projection as figure JSON"""
+    future_dates = pd.date_range(start=daily_followers['timestamp'].iloc[-1] + timedelta(days=1), periods=len(future_followers), freq='D')
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=daily_followers['timestamp'],
+        y=daily_followers['follower_count'],
+        name='Actual',
+        line=dict(color='#10b981', width=3)
+    ))
+    fig.add_trace(go.Scatter(
+        x=future_dates,
+        y=future_followers,
+        name='Prediction',
+        line=dict(color='#fbbf24', width=3, dash='dash')
+    ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        hovermode='x unified'
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _engagement_trend_fig(daily_likes, ma7, ma30):
+    """Cached daily likes with 7/30-day moving averages as figure JSON"""
+    fig = go.Figure()
+    # Actual data
+    trend_x, trend_y = _downsample_series(daily_likes['timestamp'], daily_likes['likes'])
+    fig.add_trace(go.Scattergl(
+        x=trend_x,
+        y=trend_y,
+        name='Daily',
+        line=dict(color='#667eea', width=1),
+        mode='lines'
+    ))
+    # 7-day moving average
+    ma_x, ma_y = _downsample_series(daily_likes['timestamp'], ma7)
+    fig.add_trace(go.Scattergl(
+        x=ma_x,
+        y=ma_y,
+        name='7-Day MA',
+        line=dict(color='#f093fb', width=2)
+    ))
+    # 30-day moving average
+    ma_x, ma_y = _downsample_series(daily_likes['timestamp'], ma30)
+    fig.add_trace(go.Scattergl(
+        x=ma_x,
+        y=ma_y,
+        name='30-Day MA',
+        line=dict(color='#10b981', width=2, dash='dash')
+    ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title='Date',
+        yaxis_title='Likes',
+        hovermode='x unified'
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _growth_acceleration_fig(daily_followers, acceleration):
+    """Cached day-over-day change in follower growth rate as figure JSON"""
+    accel_x, accel_y = _downsample_series(daily_followers['timestamp'], acceleration)
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=accel_x,
+        y=accel_y,
+        name='Acceleration',
+        line=dict(color='#fbbf24', width=3),
+        mode='lines+markers'
+    ))
+    
+    fig.add_hline(y=0, line_dash="dash", line_color="#64748b")
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title='Date',
+        yaxis_title='Growth Acceleration (%)',
+        hovermode='x unified'
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _volatility_fig(daily_likes, volatility):
+    """Cached 7-day rolling std of daily likes as figure JSON"""
+    vol_x, vol_y = _downsample_series(daily_likes['timestamp'], volatility)
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=vol_x,
+        y=vol_y,
+        mode='lines',
+        name='Volatility',
+        line=dict(color='#ef4444', width=3)
+    ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title='Date',
+        yaxis_title='Engagement Volatility (Std Dev)'
+    )
+    return fig.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _confidence_band_fig(daily_likes, future_y, ci_lower, ci_upper):
+    """Cached likes forecast with its 95% band as figure JSON"""
+    future_dates = pd.date_range(start=daily_likes['timestamp'].iloc[-1] + timedelta(days=1), periods=len(future_y), freq='D')
+    
+    actual_x, actual_y = _downsample_series(daily_likes['timestamp'], daily_likes['likes'])
+    fig = go.Figure()
+    # Actual data
+    fig.add_trace(go.Scattergl(
+        x=actual_x,
+        y=actual_y,
+        name='Actual',
+        line=dict(color='#667eea', width=3)
+    ))
+    # Prediction
+    fig.add_trace(go.Scattergl(
+        x=future_dates,
+        y=future_y,
+        name='Forecast',
+        line=dict(color='#f093fb', width=3, dash='dash')
+    ))
+    # Confidence interval
+    fig.add_trace(go.Scattergl(
+        x=np.concatenate([future_dates, future_dates[::-1]]),
+        y=np.concatenate([ci_upper, ci_lower[::-1]]),
+        fill='toself',
+        fillcolor='rgba(240, 147, 251, 0.2)',
+        line=dict(color='rgba(255,255,255,0)'),
+        name='95% Confidence'
+    ))
+    
+    fig.update_layout(
+        template=_SECTION_TEMPLATE,
+        height=300,
+        xaxis_title='Date',
+        yaxis_title='Likes',
+        hovermode='x unified'
+    )
+    return fig.to_json()
+
+
 def render_predictive_analytics(data):
     """Predictive analytics with engagement forecasting"""
     from professional_dashboard import render_professional_header
     render_professional_header("🔮 Predictive Analytics", "ML-powered engagement and follower growth predictions")
-
+    
+    # Daily likes and closing follower counts back every chart in this section; the daily
+    # table shares its cache entry with the time-based trends section
+    cols = frozenset(data.columns)
+    daily = _time_aggregates(_fingerprint(data), data)['daily'] if 'timestamp' in cols else None
+    has_likes = {'timestamp', 'likes'} <= cols
+    has_followers = {'timestamp', 'follower_count'} <= cols
+    daily_likes = daily['likes'].reset_index().dropna() if has_likes else None
+    daily_followers = daily['follower_count'].reset_index().dropna() if has_followers else None
     
     # Row 1: Engagement Forecast & Follower Growth Prediction
     col1, col2 = st.columns(2)
@@ -1224,48 +1708,18 @@ def render_predictive_analytics(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">📈 30-Day Engagement Forecast</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'likes' in data.columns:
-            data['timestamp'] = pd.to_datetime(data['timestamp'])
-            daily_data = data.groupby(pd.Grouper(key='timestamp', freq='D'))['likes'].sum().reset_index().dropna()
-            
-            if len(daily_data) > 14:
-                # Simple forecasting using linear regression
-                from sklearn.linear_model import LinearRegression
-                X = np.arange(len(daily_data)).reshape(-1, 1)
-                y = daily_data['likes'].values
-                
-                model = LinearRegression()
-                model.fit(X, y)
+        if has_likes:
+            if len(daily_likes) > 14:
+                # Simple forecasting using a least-squares trend line
+                slope, intercept = _linear_fit(daily_likes['likes'].to_numpy(dtype=np.float64))
                 
                 # Predict next 30 days
-                future_X = np.arange(len(daily_data), len(daily_data) + 30).reshape(-1, 1)
-                future_y = model.predict(future_X)
-                future_dates = pd.date_range(start=daily_data['timestamp'].iloc[-1] + timedelta(days=1), periods=30, freq='D')
+                future_y = intercept + slope * np.arange(len(daily_likes), len(daily_likes) + 30)
                 
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=daily_data['timestamp'],
-                    y=daily_data['likes'],
-                    name='Actual',
-                    line=dict(color='#667eea', width=3)
-                ))
-                fig.add_trace(go.Scatter(
-                    x=future_dates,
-                    y=future_y,
-                    name='Forecast',
-                    line=dict(color='#f093fb', width=3, dash='dash')
-                ))
-                
-                fig.update_layout(
-                    template='plotly_white',
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    hovermode='x unified'
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(pio.from_json(_engagement_forecast_fig(daily_likes, future_y)), use_container_width=True)
                 
                 # Insights
-                current_avg = daily_data['likes'].tail(7).mean()
+                current_avg = daily_likes['likes'].tail(7).mean()
                 forecast_avg = future_y[:7].mean()
                 growth = ((forecast_avg - current_avg) / current_avg * 100) if current_avg > 0 else 0
                 
@@ -1280,43 +1734,14 @@ def render_predictive_analytics(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">👥 Follower Growth Prediction</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'follower_count' in data.columns:
-            daily_followers = data.groupby(pd.Grouper(key='timestamp', freq='D'))['follower_count'].last().reset_index().dropna()
-            
+        if has_followers:
             if len(daily_followers) > 7:
-                from sklearn.linear_model import LinearRegression
-                X = np.arange(len(daily_followers)).reshape(-1, 1)
-                y = daily_followers['follower_count'].values
-                
-                model = LinearRegression()
-                model.fit(X, y)
+                slope, intercept = _linear_fit(daily_followers['follower_count'].to_numpy(dtype=np.float64))
                 
                 # Predict next 30 days
-                future_X = np.arange(len(daily_followers), len(daily_followers) + 30).reshape(-1, 1)
-                future_followers = model.predict(future_X)
-                future_dates = pd.date_range(start=daily_followers['timestamp'].iloc[-1] + timedelta(days=1), periods=30, freq='D')
+                future_followers = intercept + slope * np.arange(len(daily_followers), len(daily_followers) + 30)
                 
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=daily_followers['timestamp'],
-                    y=daily_followers['follower_count'],
-                    name='Actual',
-                    line=dict(color='#10b981', width=3)
-                ))
-                fig.add_trace(go.Scatter(
-                    x=future_dates,
-                    y=future_followers,
-                    name='Prediction',
-                    line=dict(color='#fbbf24', width=3, dash='dash')
-                ))
-                
-                fig.update_layout(
-                    template='plotly_white',
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    hovermode='x unified'
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(pio.from_json(_follower_projection_fig(daily_followers, future_followers)), use_container_width=True)
                 
                 # Insights
                 current_followers = int(daily_followers['follower_count'].iloc[-1])
@@ -1337,52 +1762,18 @@ def render_predictive_analytics(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">📈 Engagement Trend Analysis</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'likes' in data.columns:
-            data['timestamp'] = pd.to_datetime(data['timestamp'])
-            daily_data = data.groupby(pd.Grouper(key='timestamp', freq='D'))['likes'].sum().reset_index().dropna()
-            
-            if len(daily_data) > 7:
+        if has_likes:
+            if len(daily_likes) > 7:
                 # Calculate moving averages
-                daily_data['MA7'] = daily_data['likes'].rolling(window=7).mean()
-                daily_data['MA30'] = daily_data['likes'].rolling(window=30).mean()
-                
-                fig_trend = go.Figure()
-                # Actual data
-                fig_trend.add_trace(go.Scatter(
-                    x=daily_data['timestamp'],
-                    y=daily_data['likes'],
-                    name='Daily',
-                    line=dict(color='#667eea', width=1),
-                    mode='lines'
-                ))
-                # 7-day moving average
-                fig_trend.add_trace(go.Scatter(
-                    x=daily_data['timestamp'],
-                    y=daily_data['MA7'],
-                    name='7-Day MA',
-                    line=dict(color='#f093fb', width=2)
-                ))
-                # 30-day moving average
-                fig_trend.add_trace(go.Scatter(
-                    x=daily_data['timestamp'],
-                    y=daily_data['MA30'],
-                    name='30-Day MA',
-                    line=dict(color='#10b981', width=2, dash='dash')
-                ))
+                likes = daily_likes['likes'].to_numpy()
+                ma7 = _moving_stats(likes, 7)[0]
+                ma30 = _moving_stats(likes, 30)[0]
                 
-                fig_trend.update_layout(
-                    template='plotly_white',
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    xaxis_title='Date',
-                    yaxis_title='Likes',
-                    hovermode='x unified'
-                )
-                st.plotly_chart(fig_trend, use_container_width=True)
+                st.plotly_chart(pio.from_json(_engagement_trend_fig(daily_likes, ma7, ma30)), use_container_width=True)
                 
                 # Trend insights
-                if len(daily_data) >= 30:
-                    recent_trend = daily_data['MA7'].tail(7).mean() - daily_data['MA7'].tail(14).head(7).mean()
+                if len(daily_likes) >= 30:
+                    recent_trend = np.nanmean(ma7[-7:]) - np.nanmean(ma7[-14:-7])
                     if recent_trend > 0:
                         st.markdown("↗️ Engagement trending upward")
                     elif recent_trend < 0:
@@ -1399,37 +1790,16 @@ def render_predictive_analytics(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">🚀 Follower Growth Acceleration</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'follower_count' in data.columns:
-            daily_followers = data.groupby(pd.Grouper(key='timestamp', freq='D'))['follower_count'].last().reset_index().dropna()
-            
+        if has_followers:
             if len(daily_followers) > 7:
                 # Calculate growth rate and acceleration
-                daily_followers['growth_rate'] = daily_followers['follower_count'].pct_change() * 100
-                daily_followers['acceleration'] = daily_followers['growth_rate'].diff()
-                
-                fig_accel = go.Figure()
-                fig_accel.add_trace(go.Scatter(
-                    x=daily_followers['timestamp'],
-                    y=daily_followers['acceleration'],
-                    name='Acceleration',
-                    line=dict(color='#fbbf24', width=3),
-                    mode='lines+markers'
-                ))
-                
-                fig_accel.add_hline(y=0, line_dash="dash", line_color="#64748b")
+                growth_rate = _pct_growth(daily_followers['follower_count'].to_numpy())
+                acceleration = np.concatenate(([np.nan], np.diff(growth_rate)))
                 
-                fig_accel.update_layout(
-                    template='plotly_white',
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    xaxis_title='Date',
-                    yaxis_title='Growth Acceleration (%)',
-                    hovermode='x unified'
-                )
-                st.plotly_chart(fig_accel, use_container_width=True)
+                st.plotly_chart(pio.from_json(_growth_acceleration_fig(daily_followers, acceleration)), use_container_width=True)
                 
                 # Acceleration insights
-                recent_accel = daily_followers['acceleration'].tail(7).mean()
+                recent_accel = np.nanmean(acceleration[-7:])
                 if recent_accel > 0:
                     st.markdown("🚀 Follower growth accelerating")
                 elif recent_accel < 0:
@@ -1449,37 +1819,18 @@ def render_predictive_analytics(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">📉 Engagement Volatility Analysis</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'likes' in data.columns:
-            data['timestamp'] = pd.to_datetime(data['timestamp'])
-            daily_data = data.groupby(pd.Grouper(key='timestamp', freq='D'))['likes'].sum().reset_index().dropna()
-            
-            if len(daily_data) > 7:
+        if has_likes:
+            if len(daily_likes) > 7:
                 # Calculate rolling standard deviation as volatility measure
-                daily_data['volatility'] = daily_data['likes'].rolling(window=7).std()
-                
-                fig_vol = go.Figure()
-                fig_vol.add_trace(go.Scatter(
-                    x=daily_data['timestamp'],
-                    y=daily_data['volatility'],
-                    mode='lines',
-                    name='Volatility',
-                    line=dict(color='#ef4444', width=3)
-                ))
+                volatility = _moving_stats(daily_likes['likes'].to_numpy(), 7, min_count=2)[1]
                 
-                fig_vol.update_layout(
-                    template='plotly_white',
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    xaxis_title='Date',
-                    yaxis_title='Engagement Volatility (Std Dev)'
-                )
-                st.plotly_chart(fig_vol, use_container_width=True)
+                st.plotly_chart(pio.from_json(_volatility_fig(daily_likes, volatility)), use_container_width=True)
                 
                 # Volatility insights
-                avg_volatility = daily_data['volatility'].mean()
+                avg_volatility = np.nanmean(volatility)
                 st.markdown(f"📊 Average volatility: **{avg_volatility:.1f}** likes")
                 
-                if avg_volatility > daily_data['likes'].mean() * 0.3:
+                if avg_volatility > daily_likes['likes'].mean() * 0.3:
                     st.markdown("⚠️ High volatility detected - consider consistent posting schedule")
                 else:
                     st.markdown("✅ Stable engagement patterns observed")
@@ -1493,68 +1844,24 @@ def render_predictive_analytics(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">🎯 Prediction Confidence Intervals</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'likes' in data.columns:
-            data['timestamp'] = pd.to_datetime(data['timestamp'])
-            daily_data = data.groupby(pd.Grouper(key='timestamp', freq='D'))['likes'].sum().reset_index().dropna()
-            
-            if len(daily_data) > 14:
+        if has_likes:
+            if len(daily_likes) > 14:
                 # Calculate confidence intervals using standard error
-                from sklearn.linear_model import LinearRegression
-                X = np.arange(len(daily_data)).reshape(-1, 1)
-                y = daily_data['likes'].values
-                
-                model = LinearRegression()
-                model.fit(X, y)
+                y = daily_likes['likes'].to_numpy(dtype=np.float64)
+                slope, intercept = _linear_fit(y)
                 
                 # Predict with confidence intervals
-                future_X = np.arange(len(daily_data), len(daily_data) + 30).reshape(-1, 1)
-                future_y = model.predict(future_X)
+                future_y = intercept + slope * np.arange(len(y), len(y) + 30)
                 
                 # Calculate standard error for confidence intervals
-                residuals = y - model.predict(X)
-                mse = np.mean(residuals**2)
-                std_error = np.sqrt(mse)
+                residuals = y - (intercept + slope * np.arange(len(y)))
+                std_error = np.sqrt(residuals @ residuals / len(residuals))
                 
                 # 95% confidence intervals
                 ci_upper = future_y + 1.96 * std_error
                 ci_lower = future_y - 1.96 * std_error
-                
-                future_dates = pd.date_range(start=daily_data['timestamp'].iloc[-1] + timedelta(days=1), periods=30, freq='D')
-                
-                fig_ci = go.Figure()
-                # Actual data
-                fig_ci.add_trace(go.Scatter(
-                    x=daily_data['timestamp'],
-                    y=daily_data['likes'],
-                    name='Actual',
-                    line=dict(color='#667eea', width=3)
-                ))
-                # Prediction
-                fig_ci.add_trace(go.Scatter(
-                    x=future_dates,
-                    y=future_y,
-                    name='Forecast',
-                    line=dict(color='#f093fb', width=3, dash='dash')
-                ))
-                # Confidence interval
-                fig_ci.add_trace(go.Scatter(
-                    x=np.concatenate([future_dates, future_dates[::-1]]),
-                    y=np.concatenate([ci_upper, ci_lower[::-1]]),
-                    fill='toself',
-                    fillcolor='rgba(240, 147, 251, 0.2)',
-                    line=dict(color='rgba(255,255,255,0)'),
-                    name='95% Confidence'
-                ))
-                
-                fig_ci.update_layout(
-                    template='plotly_white',
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    xaxis_title='Date',
-                    yaxis_title='Likes',
-                    hovermode='x unified'
-                )
-                st.plotly_chart(fig_ci, use_container_width=True)
+
+                st.plotly_chart(pio.from_json(_confidence_band_fig(daily_likes, future_y, ci_lower, ci_upper)), use_container_width=True)
                 
                 # Confidence insights
                 st.markdown(f"🎯 Forecast range: {int(ci_lower[0])} - {int(ci_upper[0])} likes (next day)")
@@ -8,6 +8,9 @@ from datetime import datetime
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_FILE = os.path.join(BASE_DIR, 'social_media_analytics.db')
 
+# Range of the int32 dtype used for loaded metric columns
+INT32_MIN, INT32_MAX = -2**31, 2**31 - 1
+
 def get_db_connection():
     """Create a database connection"""
     conn = sqlite3.connect(DB_FILE)
@@ -177,16 +180,32 @@ def load_data():
     try:
         df = pd.read_sql("SELECT * FROM posts", conn)
         
-        # Convert timestamp back to datetime
+        # Convert timestamp back to datetime once here so render code can reuse it
         if not df.empty and 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+            # save_data stores str(Timestamp), so the ISO8601 fast path applies
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', errors='coerce', cache=True)
+            df['hour'] = df['timestamp'].dt.hour.astype('Int8')
         
         # Convert numeric columns to proper data types
         numeric_columns = ['likes', 'comments', 'shares', 'saves', 'impressions', 'reach', 'follower_count']
         for col in numeric_columns:
             if col in df.columns:
-                # Convert to numeric, replacing invalid values with 0
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(int)
+                # Convert to numeric, replacing invalid values with 0;
+                # int32 halves the bytes moved by downstream groupby aggregations,
+                # but a column that would overflow it keeps int64
+                values = pd.to_numeric(df[col], errors='coerce').fillna(0)
+                fits_int32 = values.between(INT32_MIN, INT32_MAX).all()
+                df[col] = values.astype('int32' if fits_int32 else 'int64')
+        
+        # Arrow-backed strings give faster .str methods and skip astype(str) copies
+        for col in ['caption', 'hashtags']:
+            if col in df.columns:
+                df[col] = df[col].fillna('').astype('string[pyarrow]')
+        
+        # Low-cardinality labels grouped and counted across the dashboard group on integer codes as categoricals
+        for col in ['media_type', 'audience_gender', 'audience_age', 'location']:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
             
         return df
     except Exception as e:
@@ -195,6 +214,33 @@ def load_data():
     finally:
         conn.close()
 
+def get_data_summary():
+    """Return (row_count, min_timestamp, max_timestamp) without loading the posts table"""
+    conn = get_db_connection()
+    try:
+        row = conn.execute("SELECT COUNT(*), MIN(timestamp), MAX(timestamp) FROM posts").fetchone()
+        return row[0], row[1], row[2]
+    except Exception as e:
+        print(f"Error reading data summary: {e}")
+        return 0, None, None
+    finally:
+        conn.close()
+
+def get_data_version():
+    """(row_count, max_rowid, latest created_at) of the posts table; changes whenever posts are written, None if unreadable
+
+    Keyed on the posts table rather than the database file, so the ML pipeline's
+    writes to its own tables do not count as a new version.
+    """
+    conn = get_db_connection()
+    try:
+        return tuple(conn.execute("SELECT COUNT(*), MAX(rowid), MAX(created_at) FROM posts").fetchone())
+    except Exception as e:
+        print(f"Error reading data version: {e}")
+        return None
+    finally:
+        conn.close()
+
 def parse_csv_files_in_data_dir(data_dir, adapter_func):
     """Parse all CSV files in data directory and save to DB with enhanced error handling"""
     if not os.path.exists(data_dir):
@@ -253,3 +299,5 @@ def parse_csv_files_in_data_dir(data_dir, adapter_func):
 if __name__ == "__main__":
     init_db()
     print("Database initialized.")
+    count, first, last = get_data_summary()
+    print(f"📊 {count} records ({first} → {last})")
@@ -9,10 +9,6 @@ import plotly.graph_objects as go
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import timedelta
-from sklearn.ensemble import GradientBoostingRegressor
-from sklearn.cluster import KMeans, DBSCAN
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import silhouette_score
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -36,6 +32,9 @@ except Exception as e:
 @st.cache_data(show_spinner=False)
 def calculate_gb_forecast(daily_data, horizon):
     """Cached calculation for Gradient Boosting Forecast"""
+    # sklearn (and scipy behind it) is imported on first use rather than with the dashboard
+    from sklearn.ensemble import GradientBoostingRegressor
+    
     X = np.arange(len(daily_data)).reshape(-1, 1)
     X_poly = np.column_stack([X, X**2, X**3])
     y = daily_data['follower_count'].values
@@ -67,6 +66,11 @@ def render_deep_learning_forecast(data):
     from professional_dashboard import render_professional_header
     render_professional_header("🧠 Deep Learning Time Series", "Neural network predictions & seasonal forecasting")
 
+    # Both forecasts start from the daily closing follower count, resampled once from the two columns
+    has_followers = 'timestamp' in data.columns and 'follower_count' in data.columns
+    if has_followers:
+        followers = data['follower_count'].set_axis(pd.DatetimeIndex(pd.to_datetime(data['timestamp']), name='timestamp'))
+        daily = followers.resample('D').last().reset_index().dropna()
     
     col1, col2 = st.columns(2)
     
@@ -74,11 +78,7 @@ def render_deep_learning_forecast(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">📈 90-Day Follower Forecast</div>', unsafe_allow_html=True)
         
-        if 'timestamp' in data.columns and 'follower_count' in data.columns:
-            df = data.copy()
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            daily = df.groupby(pd.Grouper(key='timestamp', freq='D'))['follower_count'].last().reset_index().dropna()
-            
+        if has_followers:
             if len(daily) > 14:
                 horizons = [7, 30, 60, 90]
                 colors = ['#10b981', '#f59e0b', '#f97316', '#ef4444']
@@ -120,12 +120,8 @@ def render_deep_learning_forecast(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">🔮 Prophet Seasonal Forecast</div>', unsafe_allow_html=True)
         
-        if PROPHET_AVAILABLE and 'timestamp' in data.columns and 'follower_count' in data.columns:
+        if PROPHET_AVAILABLE and has_followers:
             try:
-                df = data.copy()
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
-                daily = df.groupby(pd.Grouper(key='timestamp', freq='D'))['follower_count'].last().reset_index().dropna()
-
                 if len(daily) > 30:
                     forecast = calculate_prophet_forecast(daily[['timestamp', 'follower_count']])
                     if forecast is not None:
@@ -256,6 +252,9 @@ def render_sentiment_analysis(data):
 @st.cache_data(show_spinner=False)
 def calculate_clustering(features_df, k=3):
     """Cached K-Means clustering"""
+    from sklearn.cluster import KMeans
+    from sklearn.preprocessing import StandardScaler
+    
     features_filled = features_df.fillna(0)
     scaler = StandardScaler()
     features_scaled = scaler.fit_transform(features_filled)
@@ -265,6 +264,16 @@ def calculate_clustering(features_df, k=3):
     # Return clusters and scaled features for silhouette calculation
     return clusters, features_scaled
 
+@st.cache_data(show_spinner=False)
+def calculate_cluster_diagnostics(features_scaled, clusters):
+    """Cached silhouette score of the K-Means segments and DBSCAN labels on the same scaled features"""
+    from sklearn.cluster import DBSCAN
+    from sklearn.metrics import silhouette_score
+    
+    score = silhouette_score(features_scaled, clusters)
+    clusters_db = DBSCAN(eps=0.5, min_samples=5).fit_predict(features_scaled)
+    return score, clusters_db
+
 def render_audience_clustering(data):
     """K-Means & DBSCAN clustering"""
     st.markdown('<div class="pro-header fade-in">', unsafe_allow_html=True)
@@ -284,6 +293,7 @@ def render_audience_clustering(data):
         st.markdown('<div class="pro-chart-title">🎯 K-Means Segments</div>', unsafe_allow_html=True)
         
         clusters, features_scaled = calculate_clustering(data[required], k=3)
+        score, clusters_db = calculate_cluster_diagnostics(features_scaled, clusters)
         df_cluster = data.copy()
         df_cluster['segment'] = clusters
         
@@ -302,7 +312,6 @@ def render_audience_clustering(data):
                           legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
         st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
         
-        score = silhouette_score(features_scaled, clusters)
         st.markdown(f"""
         <div style="display: flex; justify-content: space-between; align-items: center; margin-top: 1rem;">
             <div style="font-size: 0.85rem; color: #64748b;">Clustering Quality:</div>
@@ -315,8 +324,6 @@ def render_audience_clustering(data):
         st.markdown('<div class="pro-glass-card fade-in">', unsafe_allow_html=True)
         st.markdown('<div class="pro-chart-title">🔍 DBSCAN Patterns</div>', unsafe_allow_html=True)
         
-        dbscan = DBSCAN(eps=0.5, min_samples=5)
-        clusters_db = dbscan.fit_predict(features_scaled)
         summary = pd.Series(clusters_db).value_counts().sort_index().reset_index()
         summary.columns = ['cid', 'count']
         summary['label'] = summary['cid'].apply(lambda x: 'Viral Outliers' if x == -1 else f'Pattern {x+1}')
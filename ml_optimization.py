@@ -10,6 +10,8 @@ import plotly.express as px
 import warnings
 warnings.filterwarnings('ignore')
 
+from calendar_constants import DAYS_ORDER
+
 # Import functions from ml_advanced
 # Avoid circular imports by not importing render functions at top level
 # from ml_advanced import render_deep_learning_forecast, render_sentiment_analysis, render_audience_clustering
@@ -114,21 +116,22 @@ def render_advanced_optimization(data):
         
         if 'timestamp' in data.columns and 'likes' in data.columns:
             # Reusing optimized heatmap logic with Plotly
-            data['timestamp'] = pd.to_datetime(data['timestamp'])
-            data['hour'] = data['timestamp'].dt.hour
-            data['day_of_week'] = data['timestamp'].dt.day_name()
+            timestamps = data['timestamp']
+            if not pd.api.types.is_datetime64_any_dtype(timestamps):
+                timestamps = pd.to_datetime(timestamps)
             
-            heatmap_data = data.pivot_table(values='likes', index='day_of_week', columns='hour', aggfunc='mean', fill_value=0)
-            days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            heatmap_data = heatmap_data.reindex([d for d in days_order if d in heatmap_data.index])
+            # Pivot on integer weekday codes, already in Monday-first order, and name the rows for display
+            day_codes = timestamps.dt.dayofweek.rename('day_of_week')
+            hours = timestamps.dt.hour.rename('hour')
+            heatmap_data = data.pivot_table(values='likes', index=day_codes, columns=hours, aggfunc='mean', fill_value=0)
+            heatmap_data.index = np.asarray(DAYS_ORDER)[heatmap_data.index.to_numpy(dtype=np.int64)]
             
             fig = go.Figure(data=go.Heatmap(
                 z=heatmap_data.values,
                 x=heatmap_data.columns,
                 y=heatmap_data.index,
                 colorscale='Viridis',
-                text=heatmap_data.values.round(0),
-                texttemplate="%{text}",
+                texttemplate="%{z:.0f}",
                 textfont={"size": 10}
             ))
             
@@ -157,7 +160,7 @@ def render_advanced_optimization(data):
         
         if 'media_type' in data.columns and 'likes' in data.columns:
             current_mix = data['media_type'].value_counts(normalize=True) * 100
-            type_performance = data.groupby('media_type')['likes'].mean()
+            type_performance = data.groupby('media_type', observed=True)['likes'].mean()
             optimal_mix = (type_performance / type_performance.sum() * 100)
             
             comparison = pd.DataFrame({'Current': current_mix, 'Optimal': optimal_mix}).reset_index()
@@ -12,6 +12,8 @@ import warnings
 import json
 warnings.filterwarnings('ignore')
 
+from calendar_constants import DAYS_ORDER
+
 # Import required modules
 try:
     from data_adapter import adapt_csv_data
@@ -269,7 +271,8 @@ def run_optimization_module(data):
                 return {"module": "optimization", "status": "skipped", "reason": "No valid timestamp data", "timestamp": datetime.now()}
             
             data_copy['hour'] = data_copy['timestamp'].dt.hour
-            data_copy['day_of_week'] = data_copy['timestamp'].dt.day_name()
+            # Integer weekday codes group faster than name strings; names are attached to the results only
+            data_copy['day_of_week'] = data_copy['timestamp'].dt.dayofweek
             
             # Find optimal posting times
             if 'hour' in data_copy.columns and 'day_of_week' in data_copy.columns:
@@ -287,7 +290,7 @@ def run_optimization_module(data):
                 if not heatmap_data.empty:
                     try:
                         best_idx = np.unravel_index(heatmap_data.values.argmax(), heatmap_data.values.shape)
-                        best_day = heatmap_data.index[best_idx[0]] if len(heatmap_data.index) > best_idx[0] else "Unknown"
+                        best_day = DAYS_ORDER[heatmap_data.index[best_idx[0]]] if len(heatmap_data.index) > best_idx[0] else "Unknown"
                         best_hour = int(heatmap_data.columns[best_idx[1]]) if len(heatmap_data.columns) > best_idx[1] else -1
                         best_likes = heatmap_data.values[best_idx]
                         
@@ -308,6 +311,7 @@ def run_optimization_module(data):
                         print(f"⚠️  Optimization analysis failed: {analysis_error}")
                         # Return basic statistics as fallback
                         avg_likes_by_day = data_copy.groupby('day_of_week')['likes'].mean().sort_values(ascending=False)
+                        avg_likes_by_day.index = np.asarray(DAYS_ORDER)[avg_likes_by_day.index.to_numpy()].tolist()
                         avg_likes_by_hour = data_copy.groupby('hour')['likes'].mean().sort_values(ascending=False)
                         
                         fallback_result = {
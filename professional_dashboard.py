@@ -15,9 +15,6 @@ import os
 import io
 import base64
 import requests
-from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, accuracy_score
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -936,12 +933,14 @@ def render_professional_dashboard(data):
         "High-level summary of performance with AI-generated insights and recommendations"
     )
     
-    # Calculate metrics with period comparison
+    # Calculate metrics with period comparison; parse on a local copy so the session frame is not mutated
     if 'timestamp' in data.columns:
-        data['timestamp'] = pd.to_datetime(data['timestamp'])
-        current_period = data[data['timestamp'] >= (data['timestamp'].max() - timedelta(days=7))]
-        previous_period = data[(data['timestamp'] >= (data['timestamp'].max() - timedelta(days=14))) & 
-                              (data['timestamp'] < (data['timestamp'].max() - timedelta(days=7)))]
+        if not pd.api.types.is_datetime64_any_dtype(data['timestamp']):
+            data = data.assign(timestamp=pd.to_datetime(data['timestamp']))
+        latest = data['timestamp'].max()
+        current_period = data[data['timestamp'] >= (latest - timedelta(days=7))]
+        previous_period = data[(data['timestamp'] >= (latest - timedelta(days=14))) & 
+                              (data['timestamp'] < (latest - timedelta(days=7)))]
     else:
         current_period = data
         previous_period = data
@@ -1151,7 +1150,7 @@ def render_professional_dashboard(data):
         if 'media_type' in data.columns and 'likes' in data.columns:
             # For large datasets, sample data for performance
             sampled_data = current_period if len(current_period) <= 500 else current_period.sample(n=500, random_state=42)
-            type_performance = sampled_data.groupby('media_type')['likes'].mean()
+            type_performance = sampled_data.groupby('media_type', observed=True)['likes'].mean()
             if len(type_performance) > 0:
                 best_type = type_performance.idxmax()
         
@@ -1424,7 +1423,7 @@ def render_professional_dashboard(data):
         
         # Content type analysis
         if 'media_type' in data.columns and 'likes' in data.columns:
-            content_performance = data.groupby('media_type').agg({
+            content_performance = data.groupby('media_type', observed=True).agg({
                 'likes': 'mean',
                 'comments': 'mean',
                 'shares': 'mean'
@@ -1465,12 +1464,10 @@ def render_professional_dashboard(data):
     
     if 'timestamp' in data.columns and 'likes' in data.columns:
         # Extract time components
-        data_time = data.copy()
-        data_time['hour'] = pd.to_datetime(data_time['timestamp']).dt.hour
-        data_time['day_of_week'] = pd.to_datetime(data_time['timestamp']).dt.day_name()
+        hour = pd.to_datetime(data['timestamp']).dt.hour.rename('hour')
         
         # Hourly engagement pattern
-        hourly_engagement = data_time.groupby('hour').agg({
+        hourly_engagement = data[['likes', 'comments', 'shares']].groupby(hour).agg({
             'likes': 'mean',
             'comments': 'mean',
             'shares': 'mean'
@@ -1520,15 +1517,12 @@ def render_deep_research_analytics(data):
             daily_data = data.groupby(pd.Grouper(key='timestamp', freq='D'))['likes'].sum().reset_index()
             
             if len(daily_data) > 7:
-                from sklearn.linear_model import LinearRegression
-                X = np.arange(len(daily_data)).reshape(-1, 1)
+                X = np.arange(len(daily_data))
                 y = daily_data['likes'].values
                 
-                model = LinearRegression()
-                # Matplotlib Predicted vs Actual
-                model = LinearRegression()
-                model.fit(X, y)
-                predictions = model.predict(X)
+                # Matplotlib Predicted vs Actual, against a closed-form least-squares trend line
+                slope, intercept = np.polyfit(X, y, 1)
+                predictions = slope * X + intercept
                 
                 fig, ax = plt.subplots(figsize=(8, 4))
                 ax.plot(daily_data['timestamp'], daily_data['likes'], label='Actual', color='#667eea', linewidth=2, marker='o')
@@ -1587,7 +1581,7 @@ def render_deep_research_analytics(data):
             }
             
             # Media type impact
-            media_impact = data.groupby('media_type')['likes'].mean().max()
+            media_impact = data.groupby('media_type', observed=True)['likes'].mean().max()
             factors_data['Factor'].append('Content Type')
             factors_data['Impact Score'].append(media_impact)
             
@@ -1948,7 +1942,7 @@ def generate_comprehensive_pdf_report(data):  # type: ignore
     story.append(Paragraph("Analysis of interaction quality across various content formats.", styles['Normal']))
     
     if 'media_type' in data.columns:
-        media_agg = data.groupby('media_type')[['likes', 'comments', 'shares']].mean().reset_index()
+        media_agg = data.groupby('media_type', observed=True)[['likes', 'comments', 'shares']].mean().reset_index()
         radar_data = [['Media Type', 'Avg Likes', 'Avg Comments', 'Avg Shares']]
         for _, row in media_agg.iterrows():
             radar_data.append([str(row['media_type']), f"{row['likes']:.1f}", f"{row['comments']:.1f}", f"{row['shares']:.1f}"])
@@ -2000,15 +1994,11 @@ def generate_comprehensive_pdf_report(data):  # type: ignore
         
         daily_followers = data.groupby(pd.Grouper(key='timestamp', freq='D'))['follower_count'].last().dropna()
         if len(daily_followers) > 7:
-            from sklearn.linear_model import LinearRegression
-            X = np.arange(len(daily_followers)).reshape(-1, 1)
             y = daily_followers.values
-            model = LinearRegression()
-            model.fit(X, y)
+            slope, intercept = np.polyfit(np.arange(len(y)), y, 1)
             
             # Predict next 30 days
-            future_X = np.arange(len(daily_followers), len(daily_followers) + 30).reshape(-1, 1)
-            future_y = model.predict(future_X)
+            future_y = slope * np.arange(len(y), len(y) + 30) + intercept
             
             forecast_data = [
                 ['Time Period', 'Predicted Followers', 'Net Growth'],
@@ -2061,6 +2051,32 @@ def generate_comprehensive_pdf_report(data):  # type: ignore
     return buffer
 
 # ==================== Professional Reports Section ====================
+@st.fragment
+def _render_report_configuration(data):
+    """Report option widgets, rerun on their own so changing an option skips the preview charts"""
+    st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
+    st.markdown('<div class="pro-chart-title">📋 Report Configuration</div>', unsafe_allow_html=True)
+    
+    report_type = st.selectbox(
+        "📄 Select Report Type",
+        ["Executive Summary", "Detailed Analytics", "Performance Report", "Custom Report"]
+    )
+    
+    date_range = st.date_input(
+        "📅 Date Range",
+        value=(data['timestamp'].min(), data['timestamp'].max()) if 'timestamp' in data.columns else (pd.Timestamp.now(), pd.Timestamp.now()),
+        key="report_date_range"
+    )
+    
+    include_sections = st.multiselect(
+        "📊 Include Sections",
+        ["KPI Summary", "Engagement Metrics", "Audience Insights", "Content Performance", "Trends Analysis", "Recommendations"],
+        default=["KPI Summary", "Engagement Metrics", "Content Performance"]
+    )
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
 def render_professional_reports(data):
     """Render professional reports with download options"""
     render_professional_header(
@@ -2072,27 +2088,7 @@ def render_professional_reports(data):
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.markdown('<div class="pro-chart-container fade-in">', unsafe_allow_html=True)
-        st.markdown('<div class="pro-chart-title">📋 Report Configuration</div>', unsafe_allow_html=True)
-        
-        report_type = st.selectbox(
-            "📄 Select Report Type",
-            ["Executive Summary", "Detailed Analytics", "Performance Report", "Custom Report"]
-        )
-        
-        date_range = st.date_input(
-            "📅 Date Range",
-            value=(data['timestamp'].min(), data['timestamp'].max()) if 'timestamp' in data.columns else (pd.Timestamp.now(), pd.Timestamp.now()),
-            key="report_date_range"
-        )
-        
-        include_sections = st.multiselect(
-            "📊 Include Sections",
-            ["KPI Summary", "Engagement Metrics", "Audience Insights", "Content Performance", "Trends Analysis", "Recommendations"],
-            default=["KPI Summary", "Engagement Metrics", "Content Performance"]
-        )
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+        _render_report_configuration(data)
     
     with col2:
         st.markdown('<div class="pro-insights fade-in">', unsafe_allow_html=True)
@@ -2213,7 +2209,7 @@ def render_professional_reports(data):
             st.plotly_chart(fig, use_container_width=True)
         with col_c2:
             if 'media_type' in data.columns:
-                media_perf = data.groupby('media_type')[['likes', 'comments', 'shares']].mean().reset_index()
+                media_perf = data.groupby('media_type', observed=True)[['likes', 'comments', 'shares']].mean().reset_index()
                 fig = px.bar(media_perf, y='media_type', x=['likes', 'comments', 'shares'], orientation='h', title="Top Content Formats (Efficiency)")
                 fig.update_layout(get_plotly_theme()['layout'])
                 st.plotly_chart(fig, use_container_width=True)
@@ -2270,10 +2266,21 @@ def render_professional_reports(data):
     st.markdown('</div>', unsafe_allow_html=True)
 
 # ==================== Cached Data Loading ====================
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@st.cache_data(persist="disk", max_entries=1, show_spinner=False)
+def _load_data_snapshot():
+    """(posts version, load_data() result), persisted to disk across app restarts under a single cache key"""
+    # Version read first, so the frame is never older than the version it is stored under
+    version = database_manager.get_data_version()
+    return version, database_manager.load_data()
+
 def get_cached_data():
-    """Load data from database with caching"""
-    return database_manager.load_data()
+    """Load data from database, reusing the parsed frame until the posts table changes"""
+    snapshot_version, data = _load_data_snapshot()
+    if snapshot_version != database_manager.get_data_version():
+        # clear() drops the superseded pickle from disk as well as memory
+        _load_data_snapshot.clear()
+        snapshot_version, data = _load_data_snapshot()
+    return data
 
 # ==================== Main Application ====================
 def main():
@@ -2330,8 +2337,8 @@ def main():
             
             # 3. Final Check & Assignment
             if not current_data.empty:
-                # Ensure timestamps are correct
-                if 'timestamp' in current_data.columns:
+                # Ensure timestamps are correct; the loader normally parses them already
+                if 'timestamp' in current_data.columns and not pd.api.types.is_datetime64_any_dtype(current_data['timestamp']):
                     current_data['timestamp'] = pd.to_datetime(current_data['timestamp'], errors='coerce')
                 
                 st.session_state.data = current_data
@@ -2463,7 +2470,7 @@ def main():
     elif st.session_state.current_page == "Dashboard":
         if st.session_state.data is not None:
             # Ensure timestamp is datetime
-            if 'timestamp' in st.session_state.data.columns:
+            if 'timestamp' in st.session_state.data.columns and not pd.api.types.is_datetime64_any_dtype(st.session_state.data['timestamp']):
                 st.session_state.data['timestamp'] = pd.to_datetime(st.session_state.data['timestamp'], errors='coerce')
             render_professional_dashboard(st.session_state.data)
         else:
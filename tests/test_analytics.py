@@ -47,3 +47,107 @@ def test_ml_prediction_logic(mock_social_data):
     
     assert 'total' in daily_engagement.columns
     assert daily_engagement['total'].sum() == (data['likes'].sum() + data['comments'].sum() + data['shares'].sum())
+
+def test_linear_forecast_matches_least_squares():
+    from advanced_techniques import _linear_forecast
+    y = np.array([3.0, 5.0, 4.0, 8.0, 9.0])
+    slope, intercept = np.polyfit(np.arange(5), y, 1)
+    forecast = _linear_forecast(y, 3)
+
+    assert len(forecast) == 3
+    assert np.allclose(forecast, slope * np.arange(5, 8) + intercept)
+    # A single observation yields a flat forecast instead of a degenerate fit
+    assert np.allclose(_linear_forecast([7], 2), [7, 7])
+
+def test_competitive_score_min_max_scaling():
+    from competitor_benchmarking import calculate_competitive_score, generate_competitor_data
+    metrics, df = generate_competitor_data(3, seed=0)
+    assert metrics.as_matrix().shape == (3, 4)
+
+    # Beating every competitor on every metric scores 100 across the board
+    best = metrics.as_matrix().max(axis=0) + 1
+    overall, scores = calculate_competitive_score(metrics, best)
+    assert overall == 100.0
+    assert set(scores.values()) == {100.0}
+
+    # Tied with all competitors means no spread, which scores a neutral 50
+    flat, _ = generate_competitor_data(1, seed=0)
+    overall, _ = calculate_competitive_score(flat, flat.as_matrix()[0])
+    assert overall == 50.0
+
+def test_simulated_account_independent_of_competitors():
+    from competitor_benchmarking import _simulate_your_data, generate_competitor_data
+    seeds = range(200)
+    yours = np.array([_simulate_your_data(seed)['followers'] for seed in seeds])
+    theirs = np.array([generate_competitor_data(1, seed=seed)[1]['followers'].iloc[0] for seed in seeds])
+
+    # Sharing a seed must not fix which account has more followers
+    below = np.mean(yours < theirs)
+    assert 0.2 < below < 0.8
+
+def test_media_performance_skips_unobserved_categories():
+    from dashboard_sections import _media_performance
+    data = pd.DataFrame({
+        'media_type': pd.Categorical(['Reel', 'Reel', 'Image'], categories=['Image', 'Reel', 'Video']),
+        'likes': [10, 30, 5],
+        'comments': [1, 3, 0],
+        'shares': [0, 2, 1]
+    })
+    performance = _media_performance(data)
+
+    # 'Video' is a category with no posts in this slice and must not become a NaN row
+    assert list(performance['media_type']) == ['Image', 'Reel']
+    assert not performance.isna().any().any()
+
+def test_hashtag_summary_explodes_and_normalizes_tags():
+    from dashboard_sections import _hashtag_summary
+    data = pd.DataFrame({
+        'hashtags': ['#Testing, #analytics', '#testing', None, ' , '],
+        'likes': [100, 50, 999, 7],
+        'reach': [1000, 500, 9999, 70]
+    })
+    summary = _hashtag_summary(data).set_index('hashtag')
+
+    assert sorted(summary.index) == ['#analytics', '#testing']
+    assert summary.loc['#testing', 'likes'] == 150
+    assert summary.loc['#testing', 'reach'] == 1500
+    assert summary.loc['#testing', 'count'] == 2
+    assert summary.loc['#analytics', 'count'] == 1
+
+def test_downsample_series_keeps_extremes():
+    from dashboard_sections import _downsample_series
+    x = np.arange(5000)
+    y = np.sin(x / 50.0)
+    y[1234] = 9.0
+    y[4321] = -9.0
+
+    xs, ys = _downsample_series(x, y, max_points=200)
+    assert len(xs) <= 200
+    assert np.all(np.diff(xs) > 0)
+    assert ys.max() == 9.0 and ys.min() == -9.0
+
+    # Short series pass through untouched
+    xs, ys = _downsample_series(x[:10], y[:10], max_points=200)
+    assert np.array_equal(xs, x[:10])
+
+def test_top_k_matches_nlargest_order():
+    from dashboard_sections import _top_k
+    values = pd.Series([5.0, 1.0, 9.0, 3.0, 8.0, np.nan, 7.0])
+
+    assert list(_top_k(values.to_numpy(), 3)) == list(values.reset_index(drop=True).nlargest(3).index)
+    # Asking for more than exist returns everything, largest first
+    assert list(_top_k([2.0, 4.0], 5)) == [1, 0]
+
+
+def test_aggregate_codes_matches_groupby():
+    from dashboard_sections import _aggregate_codes
+    codes = np.array([2, 0, 2, -1, 0, 2])
+    values = pd.DataFrame({'likes': [1, 2, 3, 4, 5, 6], 'comments': [1.0, np.nan, 3.0, 4.0, np.nan, 5.0]})
+    expected = values[codes >= 0].groupby(codes[codes >= 0])
+
+    # Means skip NaN and keep only the codes that occur
+    means = _aggregate_codes(codes, values, 4, 'mean')
+    pd.testing.assert_frame_equal(means, expected.mean(), check_index_type=False)
+    # Sums cover every code and keep integer columns integer
+    sums = _aggregate_codes(codes, values, 4, 'sum')
+    assert sums['likes'].tolist() == [7, 0, 10, 0] and sums['likes'].dtype == np.int64
@@ -55,3 +55,31 @@ def test_deduplication(mock_db, mock_social_data):
     assert len(loaded_df) == 3
     updated_record = loaded_df[loaded_df['post_id'] == 'post1']
     assert updated_record.iloc[0]['likes'] == 999
+
+def test_get_data_summary(mock_db, mock_social_data):
+    """Verify the summary matches the stored rows without loading them"""
+    assert database_manager.get_data_summary() == (0, None, None)
+
+    database_manager.save_data(mock_social_data)
+    count, first, last = database_manager.get_data_summary()
+
+    assert count == len(mock_social_data)
+    assert pd.to_datetime(first) == mock_social_data['timestamp'].min()
+    assert pd.to_datetime(last) == mock_social_data['timestamp'].max()
+
+def test_get_data_version(mock_db, mock_social_data):
+    """Verify the version changes when posts are written and stays put otherwise"""
+    before = database_manager.get_data_version()
+    assert before == database_manager.get_data_version()
+
+    database_manager.save_data(mock_social_data)
+    after = database_manager.get_data_version()
+    assert after != before
+
+    # Writes to other tables, such as the ML pipeline's results, leave the posts version alone
+    conn = database_manager.get_db_connection()
+    conn.execute("CREATE TABLE ml_results (payload TEXT)")
+    conn.execute("INSERT INTO ml_results VALUES ('x')")
+    conn.commit()
+    conn.close()
+    assert database_manager.get_data_version() == after